@@ -1,12 +1,28 @@
+import os
+
 from setuptools import find_packages, setup
 
+ext_modules = []
+# Opt-in: compile the models (Job/JobItem construction and date parsing) with
+# mypyc. Build with WEBCRAWLERAPI_USE_MYPYC=1 and mypyc installed.
+if os.environ.get("WEBCRAWLERAPI_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["--no-warn-unused-configs", "webcrawlerapi/models.py"])
+
 setup(
     name="webcrawlerapi",
     version="2.0.11",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
-        "requests>=2.25.0",
+        "requests>=2.27.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8.0"],
+        "http2": ["httpx[http2]>=0.23.0"],
+        "speedups": ["ciso8601>=2.2.0", "ijson>=3.1", "orjson>=3.0.0"],
+    },
     author="Andrew",
     email="sdk@webcrawlerapi.com",
     description="Python SDK for WebCrawler API",
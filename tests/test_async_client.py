@@ -0,0 +1,350 @@
+import asyncio
+import socket
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from webcrawlerapi.async_client import AsyncWebCrawlerAPI  # noqa: E402
+from webcrawlerapi.models import (  # noqa: E402
+    CrawlResponse,
+    Job,
+    JobStatus,
+    ScrapeId,
+    ScrapeResponse,
+    ScrapeResponseError,
+)
+
+
+def unused_port():
+    """Get a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_job_data(job_id, status="done"):
+    """Build a job payload as returned by the API."""
+    return {
+        "id": job_id,
+        "org_id": "org-456",
+        "url": "https://example.com",
+        "status": status,
+        "scrape_type": "markdown",
+        "items_limit": 10,
+        "created_at": "2023-01-01T12:00:00.000Z",
+        "updated_at": "2023-01-01T12:30:00.000Z",
+        "recommended_pull_delay_ms": 1000,
+        "job_items": [],
+    }
+
+
+class FakeAPI:
+    """Minimal in-process stand-in for the WebCrawler API."""
+
+    def __init__(self):
+        self.requests = []
+        self.job_polls = {}
+        self.accept_headers = []
+        self.polls_until_done = 0
+        self.scrape_status = "done"
+        self.send_webhooks = True
+        self.app = web.Application()
+        self.app.router.add_post("/v1/crawl", self.crawl)
+        self.app.router.add_get("/v1/job/{job_id}", self.get_job)
+        self.app.router.add_put("/v1/job/{job_id}/cancel", self.cancel_job)
+        self.app.router.add_post("/v2/scrape", self.scrape)
+        self.app.router.add_get("/v2/scrape/{scrape_id}", self.get_scrape)
+
+    async def crawl(self, request):
+        payload = await request.json()
+        self.requests.append(("crawl", payload, dict(request.headers)))
+        if payload["url"] == "invalid-url":
+            return web.json_response({"error": "Invalid URL"}, status=400)
+        job_id = f"job-{payload['url'][-1]}"
+        if payload.get("webhook_url") and self.send_webhooks:
+            self.polls_until_done = 0
+            asyncio.get_running_loop().create_task(
+                self.send_webhook(payload["webhook_url"], job_id)
+            )
+        return web.json_response({"id": job_id})
+
+    async def send_webhook(self, webhook_url, job_id):
+        async with aiohttp.ClientSession() as session:
+            async with session.post(webhook_url, json={"id": job_id}) as response:
+                self.webhook_status = response.status
+
+    async def get_job(self, request):
+        job_id = request.match_info["job_id"]
+        self.accept_headers.append(request.headers.get("Accept"))
+        polls = self.job_polls.get(job_id, 0)
+        self.job_polls[job_id] = polls + 1
+        status = "done" if polls >= self.polls_until_done else "in_progress"
+        return web.json_response(make_job_data(job_id, status))
+
+    async def cancel_job(self, request):
+        return web.json_response({"message": "Job cancelled successfully"})
+
+    async def scrape(self, request):
+        payload = await request.json()
+        self.requests.append(("scrape", payload, dict(request.headers)))
+        if payload["url"] == "invalid-url":
+            return web.json_response({"error": "Invalid URL format"}, status=400)
+        return web.json_response({"id": "scrape-123"})
+
+    async def get_scrape(self, request):
+        if self.scrape_status == "error":
+            return web.json_response(
+                {
+                    "status": "error",
+                    "success": False,
+                    "error_code": "FETCH_ERROR",
+                    "error_message": "Failed to fetch page",
+                }
+            )
+        return web.json_response(
+            {"status": "done", "success": True, "markdown": "# Scraped Content"}
+        )
+
+
+@pytest_asyncio.fixture
+async def api():
+    """Run the fake API on an ephemeral local port."""
+    fake = FakeAPI()
+    runner = web.AppRunner(fake.app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    fake.base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    yield fake
+    await runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def client(api):
+    """Create an AsyncWebCrawlerAPI client pointed at the fake API."""
+    client = AsyncWebCrawlerAPI(api_key="test-api-key", base_url=api.base_url)
+    yield client
+    await client.close()
+
+
+class TestAsyncWebCrawlerAPI:
+    """Test suite for AsyncWebCrawlerAPI client."""
+
+    def test_client_initialization(self):
+        """Test client initialization does not require a running loop."""
+        client = AsyncWebCrawlerAPI("test-key", "https://custom.api.com/")
+        assert client.base_url == "https://custom.api.com"
+        assert client.headers["Authorization"] == "Bearer test-key"
+        assert client._session is None
+
+    def test_client_requires_aiohttp(self):
+        """Test a helpful error is raised when aiohttp is missing."""
+        with patch("webcrawlerapi.async_client.aiohttp", None):
+            with pytest.raises(ImportError, match="aiohttp"):
+                AsyncWebCrawlerAPI("test-key")
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_session(self, api):
+        """Test leaving the async with block closes the HTTP session."""
+        async with AsyncWebCrawlerAPI("test-api-key", api.base_url) as client:
+            await client.crawl_async(url="https://example.com/1")
+            session = client.session
+
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_crawl_async_success(self, client, api):
+        """Test starting a crawl sends the payload and auth header."""
+        result = await client.crawl_async(url="https://example.com/1", items_limit=5)
+
+        assert isinstance(result, CrawlResponse)
+        assert result.id == "job-1"
+        _, payload, headers = api.requests[0]
+        assert payload["items_limit"] == 5
+        assert headers["Authorization"] == "Bearer test-api-key"
+        assert headers["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_crawl_async_http_error(self, client):
+        """Test HTTP errors surface as aiohttp.ClientResponseError."""
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.crawl_async(url="invalid-url")
+
+    @pytest.mark.asyncio
+    async def test_get_job_and_cancel(self, client):
+        """Test job retrieval and cancellation."""
+        job = await client.get_job("job-123")
+        assert isinstance(job, Job)
+        assert job.status == "done"
+
+        result = await client.cancel_job("job-123")
+        assert result["message"] == "Job cancelled successfully"
+
+    @pytest.mark.asyncio
+    async def test_crawl_polls_until_terminal(self, client, api):
+        """Test crawl sleeps on the event loop between polls."""
+        api.polls_until_done = 2
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            job = await client.crawl(url="https://example.com/1")
+
+        assert job.status == "done"
+        assert mock_sleep.await_count == 2
+        mock_sleep.assert_awaited_with(1.0)
+        # Three status-only polls, then one full fetch of the finished job
+        status_accept = "application/json; fields=status,recommended_pull_delay_ms"
+        assert api.accept_headers[:3] == [status_accept] * 3
+        assert api.accept_headers[3] != status_accept
+        assert len(api.accept_headers) == 4
+
+    @pytest.mark.asyncio
+    async def test_crawl_stops_at_deadline(self, client, api):
+        """Test crawl returns the last known state once max_wait_seconds pass."""
+        api.polls_until_done = 100
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            job = await client.crawl(url="https://example.com/1", max_wait_seconds=0)
+
+        assert job.status == "in_progress"
+        mock_sleep.assert_not_awaited()
+        assert api.job_polls == {"job-1": 2}
+
+    @pytest.mark.asyncio
+    async def test_get_job_status_only(self, client):
+        """Test status polling returns only the polling fields."""
+        status = await client.get_job_status_only("job-123")
+
+        assert status == JobStatus(
+            id="job-123", status="done", recommended_pull_delay_ms=1000
+        )
+
+    @pytest.mark.asyncio
+    async def test_crawl_many_runs_jobs_concurrently(self, client, api):
+        """Test crawl_many returns one job per URL in input order."""
+        api.polls_until_done = 1
+        urls = ["https://example.com/1", "https://example.com/2"]
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            jobs = await client.crawl_many(urls, items_limit=3)
+
+        assert [job.id for job in jobs] == ["job-1", "job-2"]
+        assert all(job.status == "done" for job in jobs)
+        assert all(payload["items_limit"] == 3 for _, payload, _ in api.requests)
+
+    @pytest.mark.asyncio
+    async def test_crawl_many_keeps_results_of_other_urls(self, client, api):
+        """Test a failing URL returns its error without losing the other jobs."""
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            results = await client.crawl_many(["invalid-url", "https://example.com/1"])
+
+        assert isinstance(results[0], aiohttp.ClientResponseError)
+        assert results[0].status == 400
+        assert isinstance(results[1], Job)
+        assert results[1].id == "job-1"
+
+    @pytest.mark.asyncio
+    async def test_crawl_with_webhook(self, client, api):
+        """Test crawl_with_webhook waits for the webhook instead of polling."""
+        api.polls_until_done = 100
+        port = unused_port()
+
+        job = await client.crawl_with_webhook(
+            "https://example.com/1",
+            port=port,
+            public_url=f"http://127.0.0.1:{port}",
+        )
+
+        assert job.status == "done"
+        assert api.webhook_status == 200
+        assert api.job_polls == {"job-1": 1}
+        _, payload, _ = api.requests[0]
+        assert payload["webhook_url"].startswith(f"http://127.0.0.1:{port}/webhook/")
+
+    @pytest.mark.asyncio
+    async def test_crawl_with_webhook_safety_poll(self, client, api):
+        """Test crawl_with_webhook checks the job when no webhook arrives."""
+        api.polls_until_done = 2
+        api.send_webhooks = False
+        client.WEBHOOK_SAFETY_POLL_SECONDS = 0.01
+
+        job = await client.crawl_with_webhook(
+            "https://example.com/1", public_url="http://unreachable.test"
+        )
+
+        assert job.status == "done"
+        # Three status-only safety polls, then one full fetch of the finished job
+        assert api.job_polls == {"job-1": 4}
+
+    @pytest.mark.asyncio
+    async def test_crawl_with_webhook_stops_at_deadline(self, client, api):
+        """Test crawl_with_webhook returns the running job once the budget is spent."""
+        api.polls_until_done = 100
+        api.send_webhooks = False
+
+        job = await client.crawl_with_webhook(
+            "https://example.com/1",
+            public_url="http://unreachable.test",
+            max_wait_seconds=0.01,
+        )
+
+        assert job.status == "in_progress"
+        assert api.job_polls == {"job-1": 1}
+
+    @pytest.mark.asyncio
+    async def test_crawl_with_webhook_requires_public_url(self, client, api):
+        """Test the listener's public URL must always be given."""
+        with pytest.raises(TypeError, match="public_url"):
+            await client.crawl_with_webhook("https://example.com/1")
+
+        assert api.requests == []
+
+    @pytest.mark.asyncio
+    async def test_crawl_with_webhook_rejects_webhook_url(self, client, api):
+        """Test the caller cannot override the listener's webhook URL."""
+        with pytest.raises(TypeError, match="webhook_url"):
+            await client.crawl_with_webhook(
+                "https://example.com/1",
+                public_url="http://unreachable.test",
+                webhook_url="https://example.com/hook",
+            )
+
+        assert api.requests == []
+
+    @pytest.mark.asyncio
+    async def test_scrape_success(self, client):
+        """Test scrape returns the finished result."""
+        result = await client.scrape(url="https://example.com")
+
+        assert isinstance(result, ScrapeResponse)
+        assert result.markdown == "# Scraped Content"
+
+    @pytest.mark.asyncio
+    async def test_scrape_error(self, client, api):
+        """Test scrape returns error responses without polling."""
+        api.scrape_status = "error"
+
+        result = await client.scrape(url="https://example.com")
+
+        assert isinstance(result, ScrapeResponseError)
+        assert result.error_code == "FETCH_ERROR"
+
+    @pytest.mark.asyncio
+    async def test_scrape_async_error_response(self, client):
+        """Test scrape_async includes the API error message."""
+        with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+            await client.scrape_async(url="invalid-url")
+
+        assert exc_info.value.status == 400
+        assert "Invalid URL format" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_scrape_async_success(self, client):
+        """Test scrape_async returns the scrape ID."""
+        result = await client.scrape_async(url="https://example.com")
+
+        assert isinstance(result, ScrapeId)
+        assert result.id == "scrape-123"
@@ -1,15 +1,21 @@
+import json
+import threading
+import warnings
+from concurrent.futures import Future
 from datetime import datetime
-from unittest.mock import Mock, patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, call, patch
 
 import pytest
 import requests
 import responses
 
-from webcrawlerapi.client import WebCrawlerAPI
+from webcrawlerapi.client import JobHandle, WebCrawlerAPI, orjson
 from webcrawlerapi.models import (
     CrawlResponse,
     Job,
     JobItem,
+    JobStatus,
     ScrapeId,
     ScrapeResponse,
     ScrapeResponseError,
@@ -55,6 +61,19 @@ class TestWebCrawlerAPI:
             ],
         }
 
+    @pytest.fixture
+    def fake_clock(self):
+        """Make time.sleep advance a fake time.monotonic clock instantly."""
+        now = [0.0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        with patch("time.sleep", side_effect=sleep) as mock_sleep, patch(
+            "time.monotonic", side_effect=lambda: now[0]
+        ):
+            yield mock_sleep
+
     def test_client_initialization(self):
         """Test client initialization with API key and base URL."""
         client = WebCrawlerAPI("test-key", "https://custom.api.com")
@@ -63,6 +82,44 @@ class TestWebCrawlerAPI:
         assert client.session.headers["Authorization"] == "Bearer test-key"
         assert client.session.headers["Content-Type"] == "application/json"
 
+    def test_client_session_connection_pool(self):
+        """Test the session reuses a larger pool of keep-alive connections."""
+        client = WebCrawlerAPI("test-key")
+        adapter = client.session.get_adapter("https://api.webcrawlerapi.com")
+
+        assert adapter._pool_maxsize == WebCrawlerAPI.POOL_SIZE
+        assert adapter.max_retries.total == WebCrawlerAPI.RETRY_TOTAL
+        assert "POST" not in adapter.max_retries.allowed_methods
+        assert client.session.headers["Connection"] == "keep-alive"
+
+    def test_context_manager_closes_session(self):
+        """Test leaving the with block closes the HTTP session."""
+        client = WebCrawlerAPI("test-key")
+
+        with patch.object(client.session, "close") as mock_close:
+            with client as entered:
+                assert entered is client
+                mock_close.assert_not_called()
+
+        mock_close.assert_called_once_with()
+
+    @responses.activate
+    def test_get_job_retries_gateway_errors(self, client, mock_job_data):
+        """Test idempotent requests are retried on gateway errors."""
+        responses.add(responses.GET, "https://api.test.com/v1/job/job-123", status=503)
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123",
+            json=mock_job_data,
+            status=200,
+        )
+
+        with patch("urllib3.util.retry.Retry.sleep"):
+            job = client.get_job("job-123")
+
+        assert job.status == "done"
+        assert len(responses.calls) == 2
+
     def test_client_initialization_default_url(self):
         """Test client initialization with default base URL."""
         client = WebCrawlerAPI("test-key")
@@ -98,6 +155,65 @@ class TestWebCrawlerAPI:
         assert payload["items_limit"] == 5
         assert payload["respect_robots_txt"] is True
 
+    @responses.activate
+    def test_json_without_orjson(self, client, mock_job_data):
+        """Test requests and responses fall back to the stdlib json module."""
+        responses.add(
+            responses.POST,
+            "https://api.test.com/v1/crawl",
+            json={"id": "crawl-123"},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123",
+            json=mock_job_data,
+            status=200,
+        )
+
+        with patch("webcrawlerapi.client.orjson", None):
+            result = client.crawl_async(url="https://example.com")
+            job = client.get_job("job-123")
+
+        import json
+
+        assert result.id == "crawl-123"
+        assert job.id == "job-123"
+        request = responses.calls[0].request
+        assert json.loads(request.body)["url"] == "https://example.com"
+        assert request.headers["Content-Type"] == "application/json"
+
+    @responses.activate
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_non_json_body_raises_request_exception(self, client, use_orjson):
+        """Test a non-JSON 2xx body raises requests' JSONDecodeError."""
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123",
+            body="<html>Bad gateway</html>",
+            status=200,
+        )
+
+        with patch("webcrawlerapi.client.orjson", orjson if use_orjson else None):
+            with pytest.raises(requests.exceptions.JSONDecodeError) as exc_info:
+                client.get_job("job-123")
+
+        assert isinstance(exc_info.value, requests.exceptions.RequestException)
+        assert isinstance(exc_info.value.__cause__, json.JSONDecodeError)
+
+    @responses.activate
+    def test_non_json_status_body_raises_request_exception(self, client):
+        """Test status polling wraps parse errors in a RequestException."""
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123",
+            body="<html>Bad gateway</html>",
+            status=200,
+        )
+
+        with pytest.raises(requests.exceptions.RequestException):
+            client.get_job_status_only("job-123")
+
     @responses.activate
     def test_crawl_async_with_actions(self, client):
         """Test crawl_async with S3 upload action."""
@@ -214,7 +330,7 @@ class TestWebCrawlerAPI:
         )
 
         with patch("time.sleep") as mock_sleep:
-            job = client.crawl(url="https://example.com", max_polls=5)
+            job = client.crawl(url="https://example.com", max_wait_seconds=60)
 
             assert isinstance(job, Job)
             assert job.id == "job-123"
@@ -223,8 +339,8 @@ class TestWebCrawlerAPI:
             mock_sleep.assert_not_called()
 
     @responses.activate
-    def test_crawl_with_polling_max_polls_reached(self, client):
-        """Test crawl method that reaches max_polls limit."""
+    def test_crawl_with_polling_deadline_reached(self, client, fake_clock):
+        """Test crawl method that runs out of max_wait_seconds."""
         # Mock crawl_async response
         responses.add(
             responses.POST,
@@ -255,13 +371,536 @@ class TestWebCrawlerAPI:
                 status=200,
             )
 
-        with patch("time.sleep") as mock_sleep:
+        with patch("random.uniform", return_value=1.0):
+            job = client.crawl(url="https://example.com", max_wait_seconds=3)
+
+        assert job.status == "in_progress"
+        # Backoff of 0.5s * 1.5**polls, never below the recommended 1s and
+        # cut short by the deadline
+        assert fake_clock.call_args_list == [call(1.0), call(1.0), call(1.0)]
+
+    @responses.activate
+    def test_crawl_max_polls_is_deprecated(self, client, mock_job_data, fake_clock):
+        """Test max_polls warns and becomes a max_polls * 5s time budget."""
+        responses.add(
+            responses.POST,
+            "https://api.test.com/v1/crawl",
+            json={"id": "job-123"},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123",
+            json=dict(mock_job_data, status="in_progress", recommended_pull_delay_ms=0),
+            status=200,
+        )
+
+        with patch("random.uniform", return_value=1.0), pytest.warns(
+            DeprecationWarning, match="max_wait_seconds"
+        ):
             job = client.crawl(url="https://example.com", max_polls=3)
 
-            assert job.status == "in_progress"
-            # Should sleep 3 times (once after each poll)
-            assert mock_sleep.call_count == 3
-            mock_sleep.assert_called_with(1.0)  # recommended_pull_delay_ms / 1000
+        assert job.status == "in_progress"
+        slept = sum(args[0] for args, _ in fake_clock.call_args_list)
+        assert slept == pytest.approx(3 * client.DEFAULT_POLL_DELAY_SECONDS)
+
+    @responses.activate
+    def test_crawl_future_returns_job_handle(self, client, mock_job_data):
+        """Test crawl_future polls in the background and resolves to the job."""
+        responses.add(
+            responses.POST,
+            "https://api.test.com/v1/crawl",
+            json={"id": "job-123"},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123",
+            json=mock_job_data,
+            status=200,
+        )
+        callback = Mock()
+
+        handle = client.crawl_future(url="https://example.com")
+        handle.add_done_callback(callback)
+        job = handle.result(timeout=5)
+
+        assert isinstance(handle, JobHandle)
+        assert isinstance(handle, Future)
+        assert handle.job_id == "job-123"
+        assert job.status == "done"
+        callback.assert_called_once_with(handle)
+
+    @responses.activate
+    def test_job_handle_cancel_job_cancels_on_server(self, client, mock_job_data):
+        """Test cancel_job cancels the job and the handle resolves with it."""
+        responses.add(
+            responses.POST,
+            "https://api.test.com/v1/crawl",
+            json={"id": "job-123"},
+            status=200,
+        )
+        responses.add(
+            responses.PUT,
+            "https://api.test.com/v1/job/job-123/cancel",
+            json={"message": "Job cancelled"},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123",
+            json={**mock_job_data, "status": "cancelled"},
+            status=200,
+        )
+        polling = threading.Event()
+        cancelled = threading.Event()
+
+        def poll_until_done(job_id, max_wait_seconds, stop):
+            polling.set()
+            cancelled.wait(5)
+            return client.get_job(job_id)
+
+        with patch.object(client, "_poll_until_done", side_effect=poll_until_done):
+            handle = client.crawl_future(url="https://example.com")
+            assert polling.wait(5)
+            assert handle.cancel_job() == {"message": "Job cancelled"}
+            cancelled.set()
+            job = handle.result(timeout=5)
+
+        assert job.status == "cancelled"
+        assert not handle.cancelled()
+        assert responses.calls[1].request.method == "PUT"
+        # Future.cancel keeps its contract: a finished handle can't be cancelled
+        assert handle.cancel() is False
+
+    @responses.activate
+    def test_crawl_polls_on_calling_thread(self, client, mock_job_data):
+        """Test crawl does not depend on the shared background pool."""
+        responses.add(
+            responses.POST,
+            "https://api.test.com/v1/crawl",
+            json={"id": "job-123"},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123",
+            json=mock_job_data,
+            status=200,
+        )
+        threads = []
+
+        def get_job_status_only(job_id):
+            threads.append(threading.current_thread())
+            return JobStatus(id=job_id, status="done")
+
+        with patch("webcrawlerapi.client._poll_pool") as mock_pool, patch.object(
+            client, "get_job_status_only", side_effect=get_job_status_only
+        ):
+            job = client.crawl(url="https://example.com")
+
+        assert job.status == "done"
+        assert threads == [threading.current_thread()]
+        mock_pool.assert_not_called()
+
+    def test_poll_stops_when_stop_event_is_set(self, client, mock_job_data):
+        """Test background polling fails once the shutdown event is set."""
+        stop = threading.Event()
+        stop.set()
+        in_progress = JobStatus(
+            id="job-123", status="in_progress", recommended_pull_delay_ms=60_000
+        )
+
+        with patch.object(
+            client, "get_job_status_only", return_value=in_progress
+        ), patch.object(client, "_poll_once") as mock_poll_once, patch.object(
+            client, "get_job", return_value=Job(mock_job_data)
+        ) as mock_get_job, patch(
+            "time.sleep"
+        ) as mock_sleep:
+            with pytest.raises(RuntimeError, match="job-123"):
+                client._poll_until_done("job-123", 600, stop)
+
+        mock_poll_once.assert_not_called()
+        mock_get_job.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    def test_crawl_raw_markdown_forwards_max_wait(self, client, mock_job_data):
+        """Test crawl_raw_markdown passes the time budget on without warnings."""
+        with patch.object(
+            client, "crawl", return_value=Job(mock_job_data)
+        ) as mock_crawl, patch.object(
+            client, "get_job_markdown", return_value="# Page 1"
+        ), warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert client.crawl_raw_markdown(url="https://example.com") == "# Page 1"
+            client.crawl_raw_markdown(url="https://example.com", max_wait_seconds=30)
+
+        assert [c.kwargs["max_wait_seconds"] for c in mock_crawl.call_args_list] == [
+            client.DEFAULT_MAX_WAIT_SECONDS,
+            30,
+        ]
+
+    @responses.activate
+    def test_crawl_with_long_polling(self, mock_job_data):
+        """Test crawl long-polls the server instead of sleeping between polls."""
+        client = WebCrawlerAPI(
+            api_key="test-api-key", base_url="https://api.test.com", long_poll_ms=30000
+        )
+        responses.add(
+            responses.POST,
+            "https://api.test.com/v1/crawl",
+            json={"id": "job-123"},
+            status=200,
+        )
+        import json
+
+        seen_urls = []
+
+        def job_callback(request):
+            # The job finishes while the first long-poll request is held
+            seen_urls.append(request.url)
+            status = "in_progress" if len(seen_urls) == 1 else "done"
+            return 200, {}, json.dumps(dict(mock_job_data, status=status))
+
+        responses.add_callback(
+            responses.GET, "https://api.test.com/v1/job/job-123", callback=job_callback
+        )
+
+        with patch("time.sleep") as mock_sleep:
+            job = client.crawl(url="https://example.com")
+
+        assert job.status == "done"
+        assert seen_urls == [
+            "https://api.test.com/v1/job/job-123",
+            "https://api.test.com/v1/job/job-123?wait=30000",
+            "https://api.test.com/v1/job/job-123",
+        ]
+        mock_sleep.assert_not_called()
+
+    @responses.activate
+    def test_long_polling_waits_when_server_ignores_wait(
+        self, mock_job_data, fake_clock
+    ):
+        """Test instant long-poll answers still wait and disable long polling."""
+        client = WebCrawlerAPI(
+            api_key="test-api-key", base_url="https://api.test.com", long_poll_ms=30000
+        )
+        responses.add(
+            responses.POST,
+            "https://api.test.com/v1/crawl",
+            json={"id": "job-123"},
+            status=200,
+        )
+        seen_urls = []
+
+        def job_callback(request):
+            # The server answers at once instead of holding the request
+            seen_urls.append(request.url)
+            status = "in_progress" if len(seen_urls) < 6 else "done"
+            return 200, {}, json.dumps(dict(mock_job_data, status=status))
+
+        responses.add_callback(
+            responses.GET, "https://api.test.com/v1/job/job-123", callback=job_callback
+        )
+
+        job = client.crawl(url="https://example.com")
+
+        assert job.status == "done"
+        assert client.long_poll_ms is None
+        assert [url.endswith("?wait=30000") for url in seen_urls] == [
+            False,
+            True,
+            True,
+            True,
+            False,
+            False,
+            False,
+        ]
+        assert fake_clock.call_args_list == [call(5.0)] * 4
+
+    @responses.activate
+    def test_long_polling_skips_sleep_when_request_is_held(
+        self, mock_job_data, fake_clock
+    ):
+        """Test no client-side sleep follows a request held on the server."""
+        client = WebCrawlerAPI(
+            api_key="test-api-key", base_url="https://api.test.com", long_poll_ms=30000
+        )
+        responses.add(
+            responses.POST,
+            "https://api.test.com/v1/crawl",
+            json={"id": "job-123"},
+            status=200,
+        )
+        seen_urls = []
+
+        def job_callback(request):
+            seen_urls.append(request.url)
+            if "wait=" in request.url:
+                # Hold the request for the whole wait like a real server
+                fake_clock.side_effect(30)
+            status = "in_progress" if len(seen_urls) < 4 else "done"
+            return 200, {}, json.dumps(dict(mock_job_data, status=status))
+
+        responses.add_callback(
+            responses.GET, "https://api.test.com/v1/job/job-123", callback=job_callback
+        )
+
+        job = client.crawl(url="https://example.com")
+
+        assert job.status == "done"
+        assert client.long_poll_ms == 30000
+        assert len(seen_urls) == 5
+        fake_clock.assert_not_called()
+
+    @responses.activate
+    def test_long_polling_falls_back_when_unsupported(self, mock_job_data):
+        """Test a 400 on the wait parameter disables long polling."""
+        client = WebCrawlerAPI(
+            api_key="test-api-key", base_url="https://api.test.com", long_poll_ms=30000
+        )
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123?wait=30000",
+            json={"error": "unknown parameter"},
+            status=400,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123",
+            json=mock_job_data,
+            status=200,
+        )
+
+        job = client._poll_once("job-123", client.long_poll_ms)
+
+        assert job.status == "done"
+        assert client.long_poll_ms is None
+
+    @responses.activate
+    def test_get_job_status_only(self, client, mock_job_data):
+        """Test status polling reads only the status fields of a job."""
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123",
+            json=dict(mock_job_data, status="in_progress"),
+            status=200,
+        )
+
+        with patch("webcrawlerapi.client.Job") as mock_job:
+            status = client.get_job_status_only("job-123")
+
+        assert isinstance(status, JobStatus)
+        assert status.id == "job-123"
+        assert status.status == "in_progress"
+        assert status.recommended_pull_delay_ms == 5000
+        assert status.is_terminal is False
+        mock_job.assert_not_called()
+        assert responses.calls[0].request.headers["Accept"] == (
+            "application/json; fields=status,recommended_pull_delay_ms"
+        )
+
+    @responses.activate
+    def test_get_job_status_only_without_ijson(self, client, mock_job_data):
+        """Test status polling falls back to decoding the full body."""
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-123",
+            json=mock_job_data,
+            status=200,
+        )
+
+        with patch("webcrawlerapi.client.ijson", None):
+            status = client.get_job_status_only("job-123")
+
+        assert status.status == "done"
+        assert status.is_terminal is True
+
+    @responses.activate
+    def test_get_job_status_only_http_error(self, client):
+        """Test status polling raises HTTP errors."""
+        responses.add(responses.GET, "https://api.test.com/v1/job/job-123", status=404)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get_job_status_only("job-123")
+
+    @pytest.fixture
+    def keep_alive_server(self, mock_job_data):
+        """Serve a job over HTTP/1.1 keep-alive and record client connections."""
+        # Enough items that the polling fields are found before the body ends
+        job_items = mock_job_data["job_items"] * 2000
+        body = json.dumps(dict(mock_job_data, job_items=job_items)).encode()
+        connections = set()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                connections.add(self.client_address)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        server.connections = connections
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    def test_get_job_status_only_reuses_connection(self, keep_alive_server):
+        """Test status polls read the whole body so the connection is reused."""
+        client = WebCrawlerAPI("test-key", base_url=keep_alive_server.base_url)
+
+        for _ in range(5):
+            assert client.get_job_status_only("job-123").status == "done"
+
+        assert len(keep_alive_server.connections) == 1
+
+    def test_get_job_status_only_drops_huge_bodies(self, keep_alive_server):
+        """Test bodies over the drain limit are not downloaded in full."""
+        client = WebCrawlerAPI("test-key", base_url=keep_alive_server.base_url)
+
+        with patch("webcrawlerapi.client._DRAIN_LIMIT_BYTES", 10):
+            for _ in range(2):
+                assert client.get_job_status_only("job-123").status == "done"
+
+        assert len(keep_alive_server.connections) == 2
+
+    @responses.activate
+    def test_crawl_batch_polls_all_jobs_together(self, client, mock_job_data):
+        """Test crawl_batch starts every job and yields them as they finish."""
+        for job_id in ("job-1", "job-2"):
+            responses.add(
+                responses.POST,
+                "https://api.test.com/v1/crawl",
+                json={"id": job_id},
+                status=200,
+            )
+
+        def job_data(job_id, status, delay_ms):
+            return dict(
+                mock_job_data,
+                id=job_id,
+                status=status,
+                recommended_pull_delay_ms=delay_ms,
+                job_items=[],
+            )
+
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-1",
+            json=job_data("job-1", "in_progress", 3000),
+        )
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-1",
+            json=job_data("job-1", "done", 3000),
+        )
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-2",
+            json=job_data("job-2", "done", 2000),
+        )
+
+        with patch("time.sleep") as mock_sleep:
+            jobs = list(
+                client.crawl_batch(
+                    ["https://example.com", "https://example.org"], items_limit=5
+                )
+            )
+
+        assert sorted(job.id for job in jobs) == ["job-1", "job-2"]
+        assert jobs[-1].id == "job-1"
+        assert all(job.status == "done" for job in jobs)
+        mock_sleep.assert_called_once_with(3.0)
+
+        import json
+
+        crawl_calls = [c for c in responses.calls if c.request.method == "POST"]
+        assert len(crawl_calls) == 2
+        assert all(json.loads(c.request.body)["items_limit"] == 5 for c in crawl_calls)
+
+    @responses.activate
+    def test_crawl_batch_starts_jobs_before_iteration(self, client):
+        """Test crawl_batch starts every job before its iterator is consumed."""
+        responses.add(
+            responses.POST,
+            "https://api.test.com/v1/crawl",
+            json={"id": "job-1"},
+            status=200,
+        )
+
+        jobs = client.crawl_batch(["https://example.com", "https://example.org"])
+
+        assert len(responses.calls) == 2
+        assert all(c.request.method == "POST" for c in responses.calls)
+        jobs.close()
+
+    @responses.activate
+    def test_crawl_batch_cancels_started_jobs_on_start_failure(self, client):
+        """Test a failed start cancels the jobs that did start and raises."""
+
+        def crawl_callback(request):
+            url = json.loads(request.body)["url"]
+            if url == "https://broken.example":
+                return 400, {}, json.dumps({"error": "invalid url"})
+            return 200, {}, json.dumps({"id": "job-1"})
+
+        responses.add_callback(
+            responses.POST, "https://api.test.com/v1/crawl", callback=crawl_callback
+        )
+        responses.add(
+            responses.PUT,
+            "https://api.test.com/v1/job/job-1/cancel",
+            json={"message": "Job canceled"},
+            status=200,
+        )
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.crawl_batch(["https://example.com", "https://broken.example"])
+
+        cancel_calls = [c for c in responses.calls if c.request.method == "PUT"]
+        assert len(cancel_calls) == 1
+
+    @responses.activate
+    def test_crawl_batch_retries_failed_status_poll(self, client, mock_job_data):
+        """Test a failed status poll of one job does not drop the others."""
+        for job_id in ("job-1", "job-2"):
+            responses.add(
+                responses.POST,
+                "https://api.test.com/v1/crawl",
+                json={"id": job_id},
+                status=200,
+            )
+        responses.add(
+            responses.GET,
+            "https://api.test.com/v1/job/job-1",
+            json={"error": "internal error"},
+            status=500,
+        )
+        for job_id in ("job-1", "job-2"):
+            responses.add(
+                responses.GET,
+                f"https://api.test.com/v1/job/{job_id}",
+                json=dict(mock_job_data, id=job_id, job_items=[]),
+            )
+
+        with patch("time.sleep") as mock_sleep:
+            jobs = list(
+                client.crawl_batch(["https://example.com", "https://example.org"])
+            )
+
+        assert [job.id for job in jobs] == ["job-2", "job-1"]
+        mock_sleep.assert_called_once()
 
     @responses.activate
     def test_scrape_async_success(self, client):
@@ -452,8 +1091,8 @@ class TestWebCrawlerAPI:
             mock_sleep.assert_not_called()
 
     @responses.activate
-    def test_scrape_with_polling_max_polls(self, client):
-        """Test scrape method that reaches max_polls."""
+    def test_scrape_with_polling_deadline_reached(self, client, fake_clock):
+        """Test scrape method that runs out of max_wait_seconds."""
         # Mock scrape_async response
         responses.add(
             responses.POST,
@@ -473,11 +1112,24 @@ class TestWebCrawlerAPI:
                 status=200,
             )
 
-        with patch("time.sleep") as mock_sleep:
-            result = client.scrape(url="https://example.com", max_polls=3)
+        with patch("random.uniform", return_value=1.0):
+            result = client.scrape(url="https://example.com", max_wait_seconds=2)
 
-            assert isinstance(result, ScrapeResponse)
-            assert result.status == "in_progress"
-            # Should sleep 3 times (once after each poll)
-            assert mock_sleep.call_count == 3
-            mock_sleep.assert_called_with(5)  # DEFAULT_POLL_DELAY_SECONDS
+        assert isinstance(result, ScrapeResponse)
+        assert result.status == "in_progress"
+        # Backoff of MIN_POLL_MS * 1.5**polls, cut short by the deadline
+        assert fake_clock.call_args_list == [call(0.5), call(0.75), call(0.75)]
+
+    def test_poll_delay_backoff_is_capped_and_jittered(self, client):
+        """Test poll delay grows to MAX_POLL_MS and stays within jitter bounds."""
+        for polls in range(30):
+            delay = client._poll_delay(polls)
+            backoff = min(client.MAX_POLL_MS, client.MIN_POLL_MS * 1.5**polls) / 1000
+            assert backoff * 0.8 <= delay <= backoff * 1.2
+
+        assert client._poll_delay(0, recommended_ms=10_000) == 10.0
+
+    def test_poll_delay_does_not_overflow(self, client):
+        """Test very long polling keeps the capped delay instead of overflowing."""
+        with patch("random.uniform", return_value=1.0):
+            assert client._poll_delay(1_000_000) == client.MAX_POLL_MS / 1000
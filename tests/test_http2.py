@@ -0,0 +1,135 @@
+import json
+from unittest.mock import patch
+
+import pytest
+import requests
+
+httpx = pytest.importorskip("httpx")
+
+from webcrawlerapi.client import WebCrawlerAPI  # noqa: E402
+from webcrawlerapi.http2 import HTTPXResponse, HTTPXSession  # noqa: E402
+from webcrawlerapi.models import Job, JobStatus  # noqa: E402
+
+JOB_DATA = {
+    "id": "job-123",
+    "org_id": "org-456",
+    "url": "https://example.com",
+    "status": "done",
+    "scrape_type": "markdown",
+    "items_limit": 10,
+    "created_at": "2023-01-01T12:00:00.000Z",
+    "updated_at": "2023-01-01T12:30:00.000Z",
+    "recommended_pull_delay_ms": 2000,
+    "job_items": [],
+}
+
+
+class TestHTTP2Transport:
+    """Test suite for the optional HTTP/2 transport."""
+
+    @pytest.fixture
+    def requests_seen(self):
+        """Collect the requests received by the mock transport."""
+        return []
+
+    @pytest.fixture
+    def client(self, requests_seen):
+        """Create an HTTP/2 client backed by an in-memory transport."""
+
+        def handler(request):
+            requests_seen.append(request)
+            path = request.url.path
+            if path == "/v1/crawl":
+                return httpx.Response(200, json={"id": "job-123"})
+            if path == "/v1/job/job-123":
+                return httpx.Response(200, json=JOB_DATA)
+            if path == "/v2/scrape":
+                return httpx.Response(400, json={"error": "Invalid URL format"})
+            return httpx.Response(404, json={"error": "Not found"})
+
+        client = WebCrawlerAPI(
+            api_key="test-api-key", base_url="https://api.test.com", http2=True
+        )
+        client.session.client = httpx.Client(
+            transport=httpx.MockTransport(handler), headers=client.session.headers
+        )
+        return client
+
+    def test_http2_session_initialization(self):
+        """Test http2=True swaps the requests session for an httpx client."""
+        client = WebCrawlerAPI("test-key", http2=True)
+
+        assert isinstance(client.session, HTTPXSession)
+        assert client.session.headers["Authorization"] == "Bearer test-key"
+        assert client.session.headers["Content-Type"] == "application/json"
+
+    def test_http2_client_configuration(self):
+        """Test the httpx client enables HTTP/2 with a bounded pool."""
+        with patch("webcrawlerapi.http2.httpx.Client") as mock_client:
+            HTTPXSession(pool_size=32)
+
+        kwargs = mock_client.call_args.kwargs
+        assert kwargs["http2"] is True
+        assert kwargs["limits"].max_keepalive_connections == 32
+
+    def test_http2_requires_httpx(self):
+        """Test a helpful error is raised when httpx is missing."""
+        with patch("webcrawlerapi.http2.httpx", None):
+            with pytest.raises(ImportError, match="httpx"):
+                WebCrawlerAPI("test-key", http2=True)
+
+    def test_crawl_async_and_get_job(self, client, requests_seen):
+        """Test requests and responses go through the httpx client."""
+        response = client.crawl_async(url="https://example.com", items_limit=5)
+        job = client.get_job(response.id)
+
+        assert isinstance(job, Job)
+        assert job.status == "done"
+        assert json.loads(requests_seen[0].content)["items_limit"] == 5
+        assert requests_seen[0].headers["Authorization"] == "Bearer test-api-key"
+
+    def test_get_job_status_only(self, client):
+        """Test status polling reads the buffered httpx body."""
+        status = client.get_job_status_only("job-123")
+
+        assert status == JobStatus(
+            id="job-123", status="done", recommended_pull_delay_ms=2000
+        )
+
+    def test_http_errors_raise_requests_exceptions(self, client):
+        """Test error responses keep the requests exception types."""
+        with pytest.raises(requests.exceptions.HTTPError, match="404"):
+            client.cancel_job("job-123")
+
+        with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+            client.scrape_async(url="invalid-url")
+        assert "Invalid URL format" in str(exc_info.value)
+
+    def test_transport_errors_raise_requests_exceptions(self):
+        """Test connection failures keep the requests exception types."""
+
+        def handler(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        session = HTTPXSession(pool_size=1)
+        session.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            session.get("https://api.test.com/v1/job/job-123")
+
+    def test_timeout_tuple_is_converted(self):
+        """Test (connect, read) timeouts map onto httpx.Timeout."""
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions["timeout"])
+            return httpx.Response(200)
+
+        session = HTTPXSession(pool_size=1)
+        session.client = httpx.Client(transport=httpx.MockTransport(handler))
+        response = session.get("https://api.test.com", timeout=(5, 35))
+
+        assert isinstance(response, HTTPXResponse)
+        assert response.ok
+        assert timeouts[0]["connect"] == 5
+        assert timeouts[0]["read"] == 35
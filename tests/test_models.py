@@ -1,9 +1,11 @@
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 import pytest
 import responses
 
+from webcrawlerapi import models
 from webcrawlerapi.models import (
     Action,
     CrawlResponse,
@@ -16,6 +18,13 @@ from webcrawlerapi.models import (
     parse_datetime,
 )
 
+# Patching module globals has no effect on a mypyc-compiled models module
+# (built with WEBCRAWLERAPI_USE_MYPYC=1), so tests that rely on it are skipped
+pure_python_only = pytest.mark.skipif(
+    models.__file__.endswith((".so", ".pyd")),
+    reason="patches module globals, which compiled code does not see",
+)
+
 
 class TestParseDatetime:
     """Test suite for datetime parsing utility."""
@@ -44,6 +53,18 @@ class TestParseDatetime:
         assert result.month == 1
         assert result.day == 15
 
+    def test_parse_datetime_offset_uses_datetime_timezone(self):
+        """Test offsets parse to datetime.timezone whichever parser is used."""
+        result = parse_datetime("2023-01-15T14:30:45.123+02:00")
+
+        assert type(result.tzinfo) is timezone
+        assert result.tzinfo == timezone(timedelta(hours=2))
+
+    def test_parse_datetime_rejects_lowercase_z(self):
+        """Test a lowercase z suffix is rejected whichever parser is used."""
+        with pytest.raises(ValueError):
+            parse_datetime("2023-01-15T14:30:45.123z")
+
     def test_parse_datetime_short_microseconds(self):
         """Test parsing datetime with short microseconds (padding)."""
         dt_str = "2023-01-15T14:30:45.123Z"
@@ -66,6 +87,61 @@ class TestParseDatetime:
         assert isinstance(result, datetime)
         assert result.microsecond == 0
 
+    @pytest.mark.parametrize(
+        "dt_str, microsecond",
+        [
+            ("2023-01-15T14:30:45.123Z", 123000),
+            ("2023-01-15T14:30:45.1234567890Z", 123456),
+            ("2023-01-15T14:30:45.1+02:00", 100000),
+            ("2023-01-15T14:30:45Z", 0),
+        ],
+    )
+    def test_parse_datetime_without_ciso8601(self, dt_str, microsecond):
+        """Test the pure Python fallback matches the C parser."""
+        with patch("webcrawlerapi.models.ciso8601", None):
+            result = parse_datetime(dt_str)
+
+        assert result.microsecond == microsecond
+        assert result.utcoffset() is not None
+
+    @pure_python_only
+    def test_parse_datetime_fallback_pads_fraction(self):
+        """Test fractions fromisoformat rejects are normalized and retried."""
+        calls = []
+
+        def strict_fromisoformat(value):
+            calls.append(value)
+            if len(calls) == 1:
+                raise ValueError("Invalid isoformat string")
+            return datetime.fromisoformat(value)
+
+        with patch("webcrawlerapi.models.ciso8601", None), patch(
+            "webcrawlerapi.models._fromisoformat", strict_fromisoformat
+        ), patch("webcrawlerapi.models._FROMISOFORMAT_PARSES_Z", False):
+            result = parse_datetime("2023-01-15T14:30:45.12Z")
+
+        assert calls == [
+            "2023-01-15T14:30:45.12+00:00",
+            "2023-01-15T14:30:45.120000+00:00",
+        ]
+        assert result.microsecond == 120000
+
+    @pure_python_only
+    @pytest.mark.skipif(
+        sys.version_info < (3, 11), reason="fromisoformat parses 'Z' on 3.11+"
+    )
+    def test_parse_datetime_passes_z_through(self):
+        """Test the 'Z' suffix is not rewritten when fromisoformat parses it."""
+        with patch("webcrawlerapi.models.ciso8601", None), patch(
+            "webcrawlerapi.models._fromisoformat", wraps=datetime.fromisoformat
+        ) as mock_fromisoformat, patch(
+            "webcrawlerapi.models._FROMISOFORMAT_PARSES_Z", True
+        ):
+            result = parse_datetime("2023-01-15T14:30:45.123Z")
+
+        mock_fromisoformat.assert_called_once_with("2023-01-15T14:30:45.123Z")
+        assert result.utcoffset().total_seconds() == 0
+
 
 class TestDataclassModels:
     """Test suite for simple dataclass models."""
@@ -374,6 +450,41 @@ class TestJob:
             assert isinstance(item, JobItem)
             assert item.job is job
 
+    def test_job_items_are_built_lazily(self, job_data):
+        """Test job items are only built when accessed, and then cached."""
+        job = Job(job_data)
+        assert len(job.job_items) == 2
+        assert job.job_items._items == {}
+
+        first = job.job_items[0]
+        assert job.job_items._items == {0: first}
+
+        assert job.job_items[0] is first
+        assert job.job_items[-1].id == "item-2"
+        assert [item.id for item in job.job_items[1:]] == ["item-2"]
+        assert [item.id for item in job.job_items] == ["item-1", "item-2"]
+        with pytest.raises(IndexError):
+            job.job_items[2]
+
+    def test_job_items_compare_like_a_list(self, job_data):
+        """Test job items compare equal to sequences with the same items."""
+        job = Job(job_data)
+
+        assert job.job_items == list(job.job_items)
+        assert job.job_items == tuple(job.job_items)
+        assert job.job_items != []
+        assert Job(dict(job_data, job_items=[])).job_items == []
+        assert job.job_items != "item-1"
+
+    def test_job_and_items_use_slots(self, job_data):
+        """Test Job and JobItem instances carry no per-instance __dict__."""
+        job = Job(job_data)
+
+        assert not hasattr(job, "__dict__")
+        assert not hasattr(job.job_items, "__dict__")
+        assert not hasattr(job.job_items[0], "__dict__")
+        assert hasattr(job, "recommended_pull_delay_ms")
+
     def test_job_minimal_data(self):
         """Test Job initialization with minimal required data."""
         minimal_data = {
@@ -14,20 +14,32 @@ Basic usage:
     >>> # Or asynchronous crawling
     >>> response = crawler.crawl_async(url="https://example.com")
     >>> job = crawler.get_job(response.id)
+    >>> # Or poll in the background and collect the job later
+    >>> handle = crawler.crawl_future(url="https://example.com")
+    >>> job = handle.result(timeout=600)
     >>> # Single page scraping (synchronous)
     >>> result = crawler.scrape(url="https://example.com", output_format="markdown")
     >>> if result.success:
     ...     print(result.markdown)  # Access the scraped content
     ... else:
     ...     print(f"Error: {result.error_message}")
+
+Asyncio usage (requires aiohttp):
+
+    >>> from webcrawlerapi import AsyncWebCrawlerAPI
+    >>> crawler = AsyncWebCrawlerAPI(api_key="your_api_key")
+    >>> jobs = await crawler.crawl_many(["https://example.com", "https://example.org"])
+    >>> await crawler.close()
 """
 
-from .client import WebCrawlerAPI
+from .async_client import AsyncWebCrawlerAPI
+from .client import JobHandle, WebCrawlerAPI
 from .models import (
     Action,
     CrawlResponse,
     Job,
     JobItem,
+    JobStatus,
     ScrapeId,
     ScrapeResponse,
     ScrapeResponseError,
@@ -37,8 +49,11 @@ from .models import (
 __version__ = "1.0.0"
 __all__ = [
     "WebCrawlerAPI",
+    "AsyncWebCrawlerAPI",
+    "JobHandle",
     "Job",
     "JobItem",
+    "JobStatus",
     "CrawlResponse",
     "ScrapeId",
     "ScrapeResponse",
@@ -0,0 +1,545 @@
+import asyncio
+import secrets
+import time
+from typing import Any, Dict, List, Optional, Union, cast
+from urllib.parse import urljoin
+
+try:
+    import aiohttp
+    from aiohttp import web
+except ImportError:  # aiohttp is an optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+from .client import (
+    _JOB_STATUS_HEADERS,
+    CRAWLER_VERSION,
+    SCRAPER_VERSION,
+    WebCrawlerAPI,
+    _backoff_delay,
+    _build_crawl_payload,
+    _build_scrape_payload,
+    _dumps,
+    _job_status_from_data,
+    _loads,
+    _parse_scrape_response,
+)
+from .models import (
+    Action,
+    CrawlResponse,
+    Job,
+    JobStatus,
+    ScrapeId,
+    ScrapeResponse,
+    ScrapeResponseError,
+)
+
+
+class AsyncWebCrawlerAPI:
+    """
+    Asyncio SDK for WebCrawler API.
+
+    Polling waits with ``asyncio.sleep`` instead of blocking a thread, so a
+    single event loop can drive many crawl and scrape jobs concurrently.
+    Requires the optional ``aiohttp`` dependency
+    (``pip install webcrawlerapi[async]``).
+
+    Use the client as an async context manager, or await ``close()``, to
+    release its pooled connections when done::
+
+        async with AsyncWebCrawlerAPI(api_key) as crawler:
+            job = await crawler.crawl(url="https://example.com")
+    """
+
+    DEFAULT_POLL_DELAY_SECONDS = WebCrawlerAPI.DEFAULT_POLL_DELAY_SECONDS
+    DEFAULT_MAX_WAIT_SECONDS = WebCrawlerAPI.DEFAULT_MAX_WAIT_SECONDS
+    MIN_POLL_MS = WebCrawlerAPI.MIN_POLL_MS
+    MAX_POLL_MS = WebCrawlerAPI.MAX_POLL_MS
+    POLL_BACKOFF_FACTOR = WebCrawlerAPI.POLL_BACKOFF_FACTOR
+    POLL_JITTER = WebCrawlerAPI.POLL_JITTER
+    WEBHOOK_SAFETY_POLL_SECONDS = 60
+    CONNECTION_LIMIT = 100
+    KEEPALIVE_TIMEOUT_SECONDS = 85
+
+    def __init__(self, api_key: str, base_url: str = "https://api.webcrawlerapi.com"):
+        """
+        Initialize the asynchronous WebCrawler API client.
+
+        The underlying ``aiohttp.ClientSession`` is created on first use, so
+        the client can be constructed outside of a running event loop.
+
+        Args:
+            api_key (str): Your API key for authentication
+            base_url (str): The base URL of the API (optional)
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncWebCrawlerAPI requires aiohttp. "
+                "Install it with: pip install webcrawlerapi[async]"
+            )
+
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        # Endpoint roots are resolved once instead of on every request
+        self._crawler_root = urljoin(self.base_url, f"/{CRAWLER_VERSION}")
+        self._scraper_root = urljoin(self.base_url, f"/{SCRAPER_VERSION}")
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """Get the shared HTTP session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(
+                    limit=self.CONNECTION_LIMIT,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT_SECONDS,
+                ),
+                raise_for_status=True,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncWebCrawlerAPI":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def crawl_async(
+        self,
+        url: str,
+        scrape_type: str = "markdown",
+        items_limit: int = 10,
+        webhook_url: Optional[str] = None,
+        whitelist_regexp: Optional[str] = None,
+        blacklist_regexp: Optional[str] = None,
+        actions: Optional[Union[Action, List[Action]]] = None,
+        respect_robots_txt: bool = False,
+        main_content_only: bool = False,
+        max_depth: Optional[int] = None,
+        max_age: Optional[int] = None,
+    ) -> CrawlResponse:
+        """
+        Start a new crawling job without waiting for it to finish.
+
+        Accepts the same arguments as ``WebCrawlerAPI.crawl_async``.
+
+        Returns:
+            CrawlResponse: Response containing the job ID
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        payload = _build_crawl_payload(
+            url=url,
+            scrape_type=scrape_type,
+            items_limit=items_limit,
+            webhook_url=webhook_url,
+            whitelist_regexp=whitelist_regexp,
+            blacklist_regexp=blacklist_regexp,
+            actions=actions,
+            respect_robots_txt=respect_robots_txt,
+            main_content_only=main_content_only,
+            max_depth=max_depth,
+            max_age=max_age,
+        )
+
+        async with self.session.post(
+            f"{self._crawler_root}/crawl", data=_dumps(payload)
+        ) as response:
+            data = await response.json(loads=_loads)
+        return CrawlResponse(id=data["id"])
+
+    async def get_job(self, job_id: str) -> Job:
+        """
+        Get the status and details of a specific job.
+
+        Args:
+            job_id (str): The unique identifier of the job
+
+        Returns:
+            Job: A Job object containing all job details and items
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        async with self.session.get(f"{self._crawler_root}/job/{job_id}") as response:
+            return Job(await response.json(loads=_loads))
+
+    async def get_job_status_only(self, job_id: str) -> JobStatus:
+        """
+        Get only the status fields of a job, without building the full Job.
+
+        Args:
+            job_id (str): The unique identifier of the job
+
+        Returns:
+            JobStatus: The job's status and recommended poll delay
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        async with self.session.get(
+            f"{self._crawler_root}/job/{job_id}", headers=_JOB_STATUS_HEADERS
+        ) as response:
+            data = await response.json(loads=_loads, content_type=None)
+        return _job_status_from_data(job_id, data)
+
+    async def cancel_job(self, job_id: str) -> Dict[str, str]:
+        """
+        Cancel a running job. All items that are not in progress and not done
+        will be marked as canceled and will not be charged.
+
+        Args:
+            job_id (str): The unique identifier of the job to cancel
+
+        Returns:
+            dict: Response containing confirmation message
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        async with self.session.put(
+            f"{self._crawler_root}/job/{job_id}/cancel"
+        ) as response:
+            return cast(Dict[str, str], await response.json(loads=_loads))
+
+    async def crawl(
+        self,
+        url: str,
+        scrape_type: str = "markdown",
+        items_limit: int = 10,
+        webhook_url: Optional[str] = None,
+        whitelist_regexp: Optional[str] = None,
+        blacklist_regexp: Optional[str] = None,
+        actions: Optional[Union[Action, List[Action]]] = None,
+        respect_robots_txt: bool = False,
+        main_content_only: bool = False,
+        max_depth: Optional[int] = None,
+        max_age: Optional[int] = None,
+        max_wait_seconds: Optional[float] = None,
+    ) -> Job:
+        """
+        Start a new crawling job and wait for its completion.
+
+        Accepts the same arguments as ``WebCrawlerAPI.crawl``, except for the
+        deprecated ``max_polls``. Waiting between polls yields to the event
+        loop instead of blocking the thread.
+
+        Returns:
+            Job: The final job state after completion or max_wait_seconds
+
+        Raises:
+            aiohttp.ClientError: If any API request fails
+        """
+        response = await self.crawl_async(
+            url=url,
+            scrape_type=scrape_type,
+            items_limit=items_limit,
+            webhook_url=webhook_url,
+            whitelist_regexp=whitelist_regexp,
+            blacklist_regexp=blacklist_regexp,
+            actions=actions,
+            respect_robots_txt=respect_robots_txt,
+            main_content_only=main_content_only,
+            max_depth=max_depth,
+            max_age=max_age,
+        )
+
+        if max_wait_seconds is None:
+            max_wait_seconds = self.DEFAULT_MAX_WAIT_SECONDS
+        return await self._poll_until_done(response.id, max_wait_seconds)
+
+    async def _poll_until_done(self, job_id: str, max_wait_seconds: float) -> Job:
+        """Poll a job until it is terminal or the time budget runs out."""
+        deadline = time.monotonic() + max_wait_seconds
+        polls = 0
+        status = await self.get_job_status_only(job_id)
+
+        while not status.is_terminal:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            delay = self._poll_delay(polls, status.recommended_pull_delay_ms)
+            await asyncio.sleep(min(delay, remaining))
+            polls += 1
+            status = await self.get_job_status_only(job_id)
+
+        # Fetch the full job once it is terminal or the budget is spent
+        return await self.get_job(job_id)
+
+    async def crawl_with_webhook(
+        self,
+        url: str,
+        *,
+        public_url: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_wait_seconds: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Job:
+        """
+        Start a crawling job and wait for its webhook instead of polling.
+
+        A temporary HTTP listener is bound to ``host``/``port`` and its
+        ``public_url`` is passed to the API as the job's ``webhook_url``. The
+        listener stays up for the whole ``max_wait_seconds`` budget. In case a
+        webhook is never delivered, the job status is also checked every
+        ``WEBHOOK_SAFETY_POLL_SECONDS``. The job is fetched once, after the
+        webhook fires, the job finishes or the budget runs out.
+
+        Args:
+            url (str): The seed URL where the crawler starts
+            public_url (str): Externally reachable base URL of the listener,
+                for example the address of a proxy or tunnel forwarding to it
+            host (str): Interface to bind the listener to (default: 127.0.0.1)
+            port (int): Port to bind the listener to (default: 0, any free port)
+            max_wait_seconds (float, optional): Maximum number of seconds to wait
+                for the job (default: DEFAULT_MAX_WAIT_SECONDS)
+            **kwargs: Extra arguments passed to ``crawl_async``
+
+        Returns:
+            Job: The final job state after completion or max_wait_seconds
+
+        Raises:
+            TypeError: If ``webhook_url`` is passed in ``kwargs``
+            aiohttp.ClientError: If any API request fails
+        """
+        if "webhook_url" in kwargs:
+            raise TypeError(
+                "crawl_with_webhook() sets webhook_url itself; "
+                "use crawl_async() to pass your own"
+            )
+        if max_wait_seconds is None:
+            max_wait_seconds = self.DEFAULT_MAX_WAIT_SECONDS
+
+        loop = asyncio.get_running_loop()
+        finished: "asyncio.Future[None]" = loop.create_future()
+        path = f"/webhook/{secrets.token_urlsafe(16)}"
+
+        async def handle_webhook(request: "web.Request") -> "web.Response":
+            if not finished.done():
+                finished.set_result(None)
+            return web.Response()
+
+        app = web.Application()
+        app.router.add_post(path, handle_webhook)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        try:
+            site = web.TCPSite(runner, host, port)
+            await site.start()
+
+            response = await self.crawl_async(
+                url, webhook_url=public_url.rstrip("/") + path, **kwargs
+            )
+            deadline = time.monotonic() + max_wait_seconds
+            while not finished.done():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                await asyncio.wait(
+                    {finished},
+                    timeout=min(self.WEBHOOK_SAFETY_POLL_SECONDS, remaining),
+                )
+                # The job is fetched below anyway once the budget is spent
+                if finished.done() or time.monotonic() >= deadline:
+                    break
+                # A slow safety poll catches a webhook that never arrives
+                status = await self.get_job_status_only(response.id)
+                if status.is_terminal:
+                    break
+        finally:
+            await runner.cleanup()
+
+        return await self.get_job(response.id)
+
+    def _poll_delay(self, polls: int, recommended_ms: Optional[int] = None) -> float:
+        """Get the number of seconds to wait before the next status poll."""
+        return _backoff_delay(
+            polls,
+            recommended_ms,
+            self.MIN_POLL_MS,
+            self.MAX_POLL_MS,
+            self.POLL_BACKOFF_FACTOR,
+            self.POLL_JITTER,
+        )
+
+    async def crawl_many(
+        self, urls: List[str], **kwargs: Any
+    ) -> List[Union[Job, BaseException]]:
+        """
+        Crawl several seed URLs concurrently and wait for all of them.
+
+        Every job is started and polled on the same event loop, so the total
+        wait is roughly that of the slowest job rather than the sum of all.
+        A failing URL does not affect the others: its exception takes its
+        place in the returned list instead of being raised.
+
+        Args:
+            urls (List[str]): The seed URLs to crawl
+            **kwargs: Extra arguments passed to ``crawl`` for every URL
+
+        Returns:
+            List[Union[Job, BaseException]]: The final job state, or the
+                exception raised while crawling, for every URL in the same
+                order as ``urls``
+        """
+        return list(
+            await asyncio.gather(
+                *(self.crawl(url, **kwargs) for url in urls), return_exceptions=True
+            )
+        )
+
+    async def scrape_async(
+        self,
+        url: str,
+        output_format: str = "markdown",
+        webhook_url: Optional[str] = None,
+        clean_selectors: Optional[str] = None,
+        prompt: Optional[str] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
+        actions: Optional[Union[Action, List[Action]]] = None,
+        respect_robots_txt: bool = False,
+        main_content_only: bool = False,
+        max_age: Optional[int] = None,
+    ) -> ScrapeId:
+        """
+        Start a new scraping job without waiting for it to finish.
+
+        Accepts the same arguments as ``WebCrawlerAPI.scrape_async``.
+
+        Returns:
+            ScrapeId: Response containing the scrape job ID
+
+        Raises:
+            aiohttp.ClientResponseError: If the API responds with an error,
+                including the error message returned by the API
+            aiohttp.ClientError: If the API request fails
+        """
+        payload = _build_scrape_payload(
+            url=url,
+            output_format=output_format,
+            webhook_url=webhook_url,
+            clean_selectors=clean_selectors,
+            prompt=prompt,
+            response_schema=response_schema,
+            actions=actions,
+            respect_robots_txt=respect_robots_txt,
+            main_content_only=main_content_only,
+            max_age=max_age,
+        )
+
+        async with self.session.post(
+            f"{self._scraper_root}/scrape?async=true",
+            data=_dumps(payload),
+            raise_for_status=False,
+        ) as response:
+            if not response.ok:
+                try:
+                    error_data = await response.json(content_type=None)
+                    detail = error_data.get("error", "Unknown error")
+                except ValueError:
+                    detail = await response.text()
+                raise aiohttp.ClientResponseError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message=f"{response.reason}: {detail}",
+                    headers=response.headers,
+                )
+            data = await response.json(loads=_loads)
+        return ScrapeId(id=data["id"])
+
+    async def get_scrape(
+        self, scrape_id: str
+    ) -> Union[ScrapeResponse, ScrapeResponseError]:
+        """
+        Get the status and result of a specific scrape job.
+
+        Args:
+            scrape_id (str): The unique identifier of the scrape job
+
+        Returns:
+            Union[ScrapeResponse, ScrapeResponseError]: The scrape result or error
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        async with self.session.get(
+            f"{self._scraper_root}/scrape/{scrape_id}"
+        ) as response:
+            return _parse_scrape_response(await response.json(loads=_loads))
+
+    async def scrape(
+        self,
+        url: str,
+        output_format: str = "markdown",
+        webhook_url: Optional[str] = None,
+        clean_selectors: Optional[str] = None,
+        prompt: Optional[str] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
+        actions: Optional[Union[Action, List[Action]]] = None,
+        respect_robots_txt: bool = False,
+        main_content_only: bool = False,
+        max_age: Optional[int] = None,
+        max_wait_seconds: Optional[float] = None,
+    ) -> Union[ScrapeResponse, ScrapeResponseError]:
+        """
+        Scrape a single URL and wait for completion.
+
+        Accepts the same arguments as ``WebCrawlerAPI.scrape``, except for the
+        deprecated ``max_polls``. Waiting between polls yields to the event
+        loop instead of blocking the thread.
+
+        Returns:
+            Union[ScrapeResponse, ScrapeResponseError]: The final scrape result
+
+        Raises:
+            aiohttp.ClientError: If any API request fails
+        """
+        response = await self.scrape_async(
+            url=url,
+            output_format=output_format,
+            webhook_url=webhook_url,
+            clean_selectors=clean_selectors,
+            prompt=prompt,
+            response_schema=response_schema,
+            actions=actions,
+            respect_robots_txt=respect_robots_txt,
+            main_content_only=main_content_only,
+            max_age=max_age,
+        )
+
+        if max_wait_seconds is None:
+            max_wait_seconds = self.DEFAULT_MAX_WAIT_SECONDS
+        scrape_id = response.id
+        deadline = time.monotonic() + max_wait_seconds
+        polls = 0
+        result = await self.get_scrape(scrape_id)
+
+        while True:
+            if isinstance(result, ScrapeResponse) and result.status == "done":
+                return result
+
+            if isinstance(result, ScrapeResponseError):
+                return result
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return result
+
+            await asyncio.sleep(min(self._poll_delay(polls), remaining))
+            polls += 1
+            result = await self.get_scrape(scrape_id)
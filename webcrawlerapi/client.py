@@ -1,13 +1,37 @@
+import atexit
+import json
+import math
+import random
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union, cast
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import fields
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union, cast
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is an optional speedup
+    ijson = None
+
+from .http2 import HTTPXResponse, HTTPXSession
 from .models import (
     Action,
     CrawlResponse,
     Job,
+    JobStatus,
     ScrapeId,
     ScrapeResponse,
     ScrapeResponseError,
@@ -16,28 +40,438 @@ from .models import (
 CRAWLER_VERSION = "v1"
 SCRAPER_VERSION = "v2"
 
+# Top-level job fields needed to drive a polling loop
+_JOB_STATUS_FIELDS = ("status", "recommended_pull_delay_ms")
+
+# Hints servers that support field selection to send only the polling fields;
+# servers that ignore the parameter return the full job as usual
+_JOB_STATUS_HEADERS = {
+    "Accept": f"application/json; fields={','.join(_JOB_STATUS_FIELDS)}"
+}
+
+# Status bodies up to this size are read to the end after the polling fields
+# are found, so the keep-alive connection goes back to the pool; larger ones
+# drop the connection instead of downloading the rest
+_DRAIN_LIMIT_BYTES = 1024 * 1024
+
+# Background polling for crawl_future is shared by every client, so N pending
+# jobs use at most _POLL_POOL_SIZE threads instead of N blocked callers
+_POLL_POOL_SIZE = 32
+_POLL_POOL: Optional[ThreadPoolExecutor] = None
+_POLL_POOL_LOCK = threading.Lock()
+# Set at interpreter exit so background polls return instead of keeping the
+# process alive until their jobs finish
+_POLL_POOL_SHUTDOWN = threading.Event()
+
+# Pool workers are joined by threading's own exit hook, which runs before
+# atexit callbacks on Python 3.9+, so the stop must be registered with it.
+# threading._register_atexit is private, but it is the hook concurrent.futures
+# itself joins its workers from. Python 3.8 has no such hook and joins them
+# from an atexit callback instead; atexit runs callbacks in reverse order, so
+# registering there still sets the stop first
+_register_atexit = getattr(threading, "_register_atexit", atexit.register)
+
+
+def _poll_pool() -> ThreadPoolExecutor:
+    """Get the shared polling thread pool, creating it on first use."""
+    global _POLL_POOL
+    with _POLL_POOL_LOCK:
+        if _POLL_POOL is None:
+            _POLL_POOL = ThreadPoolExecutor(
+                max_workers=_POLL_POOL_SIZE, thread_name_prefix="webcrawlerapi-poll"
+            )
+            # Registered after the executor's own hook, so it runs first
+            _register_atexit(_POLL_POOL_SHUTDOWN.set)
+        return _POLL_POOL
+
+
+class JobHandle(Future):
+    """
+    Future for a crawling job that is polled on a background thread.
+
+    Use ``result(timeout=...)`` to wait for the final ``Job`` or
+    ``add_done_callback(...)`` to be notified when it finishes. The handle
+    also works with ``concurrent.futures.wait`` and ``as_completed``.
+    Background polling stops when the interpreter exits; a handle whose job
+    is still running then fails with ``RuntimeError``.
+    """
+
+    def __init__(self, client: "WebCrawlerAPI", job_id: str):
+        """
+        Initialize the job handle.
+
+        Args:
+            client (WebCrawlerAPI): The client that started the job
+            job_id (str): The unique identifier of the job
+        """
+        super().__init__()
+        self.job_id = job_id
+        self._client = client
+
+    def cancel_job(self) -> Dict[str, str]:
+        """
+        Cancel the crawling job on the server.
+
+        Unlike ``cancel()``, which follows the ``Future`` contract and only
+        stops a poll that has not started yet, this always cancels the job
+        itself. A handle that is still polling then resolves with the
+        cancelled job.
+
+        Returns:
+            dict: Response containing confirmation message
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        return self._client.cancel_job(self.job_id)
+
+    def _run(self, poll: Callable[[], Job]) -> None:
+        """Run the polling loop on a pool thread and record its outcome."""
+        if not self.set_running_or_notify_cancel():
+            return
+        try:
+            job = poll()
+        except BaseException as exc:
+            self.set_exception(exc)
+        else:
+            self.set_result(job)
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request body, using orjson when it is installed."""
+    if orjson is not None:
+        return cast(bytes, orjson.dumps(payload))
+    return json.dumps(payload).encode("utf-8")
+
+
+def _loads(content: Union[bytes, str]) -> Any:
+    """
+    Deserialize a response body, using orjson when it is installed.
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not valid JSON,
+            matching ``requests.Response.json()``
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+    except json.JSONDecodeError as exc:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        raise requests.exceptions.JSONDecodeError(exc.msg, exc.doc, exc.pos) from exc
+
+
+def _read_job_status(
+    job_id: str, response: Union[requests.Response, HTTPXResponse]
+) -> JobStatus:
+    """
+    Read the polling fields from a streamed job response.
+
+    With ijson installed, the body is parsed incrementally and parsing stops
+    as soon as the top-level status fields are found, so large job_items lists
+    are never buffered. Otherwise the body is decoded in full.
+    """
+    try:
+        if ijson is None:
+            data = _loads(response.content)
+        else:
+            data = {}
+            if isinstance(response, requests.Response):
+                # Let urllib3 undo any gzip/deflate encoding while streaming
+                response.raw.decode_content = True
+            try:
+                for prefix, _, value in ijson.parse(response.raw):
+                    if prefix in _JOB_STATUS_FIELDS:
+                        data[prefix] = value
+                        if len(data) == len(_JOB_STATUS_FIELDS):
+                            break
+            except ijson.JSONError as exc:
+                raise requests.exceptions.JSONDecodeError(str(exc), "", 0) from exc
+            _drain(response)
+    finally:
+        response.close()
+
+    return _job_status_from_data(job_id, data)
+
+
+def _drain(response: Union[requests.Response, HTTPXResponse]) -> None:
+    """Read the rest of a streamed body so its connection can be reused."""
+    # httpx responses are already read in full
+    if not isinstance(response, requests.Response):
+        return
+    length = response.headers.get("Content-Length")
+    if length is not None and int(length) > _DRAIN_LIMIT_BYTES:
+        return
+
+    read = 0
+    for chunk in response.iter_content(64 * 1024):
+        read += len(chunk)
+        if read > _DRAIN_LIMIT_BYTES:
+            return
+
+
+def _job_status_from_data(job_id: str, data: Dict[str, Any]) -> JobStatus:
+    """Build a JobStatus from decoded job fields."""
+    return JobStatus(
+        id=job_id,
+        status=data["status"],
+        recommended_pull_delay_ms=int(data.get("recommended_pull_delay_ms") or 0),
+    )
+
+
+_MAX_BACKOFF_EXPONENT = 64
+
+
+def _backoff_delay(
+    polls: int,
+    recommended_ms: Optional[int],
+    min_ms: float,
+    max_ms: float,
+    factor: float,
+    jitter: float,
+) -> float:
+    """
+    Compute the number of seconds to wait before the next status poll.
+
+    The delay grows exponentially from ``min_ms`` up to ``max_ms`` with
+    random jitter, and never drops below the server-recommended delay.
+    """
+    # The exponent is capped so long waits never overflow the float power;
+    # max_ms is reached long before that
+    backoff_ms = min(max_ms, min_ms * factor ** min(polls, _MAX_BACKOFF_EXPONENT))
+    backoff_ms *= random.uniform(1 - jitter, 1 + jitter)
+    return max(recommended_ms or 0, backoff_ms) / 1000
+
+
+def _resolve_max_wait(
+    max_wait_seconds: Optional[float],
+    max_polls: Optional[int],
+    default_seconds: float,
+    poll_delay_seconds: float,
+) -> float:
+    """Get the polling time budget, mapping the deprecated max_polls onto it."""
+    if max_polls is not None:
+        warnings.warn(
+            "max_polls is deprecated, use max_wait_seconds instead",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        if max_wait_seconds is None:
+            return max_polls * poll_delay_seconds
+    return default_seconds if max_wait_seconds is None else max_wait_seconds
+
+
+def _action_to_dict(action: Action) -> Dict[str, Any]:
+    """Serialize an action for a request body."""
+    # Action fields are flat, so a shallow copy avoids asdict's deep copy
+    return {field.name: getattr(action, field.name) for field in fields(action)}
+
+
+def _build_crawl_payload(
+    url: str,
+    scrape_type: str,
+    items_limit: int,
+    webhook_url: Optional[str],
+    whitelist_regexp: Optional[str],
+    blacklist_regexp: Optional[str],
+    actions: Optional[Union[Action, List[Action]]],
+    respect_robots_txt: bool,
+    main_content_only: bool,
+    max_depth: Optional[int],
+    max_age: Optional[int],
+) -> Dict[str, Any]:
+    """Build the request body for the crawl endpoint."""
+    # A dict literal plus plain ifs is the cheapest way to build this in
+    # CPython; dict(**kwargs) and merging a filtered comprehension are slower
+    payload: Dict[str, Any] = {
+        "url": url,
+        "scrape_type": scrape_type,
+        "items_limit": items_limit,
+        "respect_robots_txt": respect_robots_txt,
+        "main_content_only": main_content_only,
+    }
+
+    if webhook_url:
+        payload["webhook_url"] = webhook_url
+    if whitelist_regexp:
+        payload["whitelist_regexp"] = whitelist_regexp
+    if blacklist_regexp:
+        payload["blacklist_regexp"] = blacklist_regexp
+    if max_depth is not None:
+        payload["max_depth"] = max_depth
+    if max_age is not None:
+        payload["max_age"] = max_age
+    if actions:
+        # Convert single action to list if needed
+        action_list = [actions] if not isinstance(actions, list) else actions
+        # Convert dataclass objects to dictionaries
+        payload["actions"] = [_action_to_dict(action) for action in action_list]
+
+    return payload
+
+
+def _build_scrape_payload(
+    url: str,
+    output_format: str,
+    webhook_url: Optional[str],
+    clean_selectors: Optional[str],
+    prompt: Optional[str],
+    response_schema: Optional[Dict[str, Any]],
+    actions: Optional[Union[Action, List[Action]]],
+    respect_robots_txt: bool,
+    main_content_only: bool,
+    max_age: Optional[int],
+) -> Dict[str, Any]:
+    """Build the request body for the scrape endpoint."""
+    payload: Dict[str, Any] = {
+        "url": url,
+        "output_format": output_format,
+        "respect_robots_txt": respect_robots_txt,
+        "main_content_only": main_content_only,
+    }
+
+    if webhook_url:
+        payload["webhook_url"] = webhook_url
+    if clean_selectors:
+        payload["clean_selectors"] = clean_selectors
+    if prompt:
+        payload["prompt"] = prompt
+    if response_schema is not None:
+        payload["response_schema"] = response_schema
+    if max_age is not None:
+        payload["max_age"] = max_age
+    if actions:
+        # Convert single action to list if needed
+        action_list = [actions] if not isinstance(actions, list) else actions
+        # Convert dataclass objects to dictionaries
+        payload["actions"] = [_action_to_dict(action) for action in action_list]
+
+    return payload
+
+
+def _parse_scrape_response(
+    response_data: Dict[str, Any],
+) -> Union[ScrapeResponse, ScrapeResponseError]:
+    """Convert a scrape status payload into a response object."""
+    status = response_data.get("status")
+
+    if status == "done":
+        return ScrapeResponse(
+            success=response_data.get("success", True),
+            status=status,
+            markdown=response_data.get("markdown"),
+            cleaned_content=response_data.get("cleaned_content"),
+            raw_content=response_data.get("raw_content"),
+            page_status_code=response_data.get("page_status_code", 0),
+            page_title=response_data.get("page_title"),
+            structured_data=response_data.get("structured_data"),
+            links=response_data.get("links"),
+        )
+    elif status == "error":
+        return ScrapeResponseError(
+            success=False,
+            error_code=response_data.get("error_code", "unknown"),
+            error_message=response_data.get("error_message", "Scraping failed"),
+            status=status,
+        )
+    else:  # in_progress or any other status
+        return ScrapeResponse(success=False, status=status)
+
 
 class WebCrawlerAPI:
-    """Python SDK for WebCrawler API."""
+    """
+    Python SDK for WebCrawler API.
 
-    DEFAULT_POLL_DELAY_SECONDS = 5
+    Use the client as a context manager, or call ``close()``, to release its
+    pooled connections when done::
 
-    def __init__(self, api_key: str, base_url: str = "https://api.webcrawlerapi.com"):
+        with WebCrawlerAPI(api_key) as crawler:
+            job = crawler.crawl(url="https://example.com")
+    """
+
+    DEFAULT_POLL_DELAY_SECONDS = 5
+    DEFAULT_MAX_WAIT_SECONDS = 500
+    MIN_POLL_MS = 500
+    MAX_POLL_MS = 30_000
+    POLL_BACKOFF_FACTOR = 1.5
+    POLL_JITTER = 0.2
+    LONG_POLL_FAST_RATIO = 0.1
+    LONG_POLL_MAX_FAST_RESPONSES = 3
+    POOL_SIZE = 32
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    RETRY_STATUS_CODES = (502, 503, 504)
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.webcrawlerapi.com",
+        long_poll_ms: Optional[int] = None,
+        http2: bool = False,
+    ):
         """
         Initialize the WebCrawler API client.
 
         Args:
             api_key (str): Your API key for authentication
             base_url (str): The base URL of the API (optional)
-            version (str): API version to use (optional, defaults to 'v1')
+            long_poll_ms (int, optional): Ask the server to hold each job status
+                request for up to this many milliseconds until the job changes,
+                instead of sleeping between polls in ``crawl``. Falls back to
+                regular polling if the server rejects the ``wait`` parameter or
+                keeps answering much sooner than requested.
+            http2 (bool): Send requests over HTTP/2 with httpx, multiplexing
+                concurrent requests on one connection (default: False).
+                Requires ``pip install webcrawlerapi[http2]``.
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
+        # Endpoint roots are resolved once instead of on every request
+        self._crawler_root = urljoin(self.base_url, f"/{CRAWLER_VERSION}")
+        self._scraper_root = urljoin(self.base_url, f"/{SCRAPER_VERSION}")
+        self.long_poll_ms = long_poll_ms
+        self.session: Union[requests.Session, HTTPXSession]
+        if http2:
+            self.session = HTTPXSession(self.POOL_SIZE)
+        else:
+            self.session = self._create_requests_session()
         self.session.headers.update(
             {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
         )
 
+    def _create_requests_session(self) -> requests.Session:
+        """Create an HTTP/1.1 session with a tuned keep-alive connection pool."""
+        session = requests.Session()
+        session.headers["Connection"] = "keep-alive"
+
+        # Keep enough pooled keep-alive connections for concurrent polling.
+        # Only idempotent requests are retried so a crawl or scrape is never
+        # submitted twice after a gateway error.
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=Retry(
+                total=self.RETRY_TOTAL,
+                backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                status_forcelist=self.RETRY_STATUS_CODES,
+                allowed_methods=["GET", "PUT"],
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "WebCrawlerAPI":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def crawl_async(
         self,
         url: str,
@@ -74,35 +508,25 @@ class WebCrawlerAPI:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        payload = {
-            "url": url,
-            "scrape_type": scrape_type,
-            "items_limit": items_limit,
-            "respect_robots_txt": respect_robots_txt,
-            "main_content_only": main_content_only,
-        }
-
-        if webhook_url:
-            payload["webhook_url"] = webhook_url
-        if whitelist_regexp:
-            payload["whitelist_regexp"] = whitelist_regexp
-        if blacklist_regexp:
-            payload["blacklist_regexp"] = blacklist_regexp
-        if max_depth is not None:
-            payload["max_depth"] = max_depth
-        if max_age is not None:
-            payload["max_age"] = max_age
-        if actions:
-            # Convert single action to list if needed
-            action_list = [actions] if not isinstance(actions, list) else actions
-            # Convert dataclass objects to dictionaries
-            payload["actions"] = [vars(action) for action in action_list]
+        payload = _build_crawl_payload(
+            url=url,
+            scrape_type=scrape_type,
+            items_limit=items_limit,
+            webhook_url=webhook_url,
+            whitelist_regexp=whitelist_regexp,
+            blacklist_regexp=blacklist_regexp,
+            actions=actions,
+            respect_robots_txt=respect_robots_txt,
+            main_content_only=main_content_only,
+            max_depth=max_depth,
+            max_age=max_age,
+        )
 
         response = self.session.post(
-            urljoin(self.base_url, f"/{CRAWLER_VERSION}/crawl"), json=payload
+            f"{self._crawler_root}/crawl", data=_dumps(payload)
         )
         response.raise_for_status()
-        return CrawlResponse(id=response.json()["id"])
+        return CrawlResponse(id=_loads(response.content)["id"])
 
     def get_job(self, job_id: str) -> Job:
         """
@@ -117,11 +541,57 @@ class WebCrawlerAPI:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        response = self.session.get(
-            urljoin(self.base_url, f"/{CRAWLER_VERSION}/job/{job_id}")
-        )
+        response = self.session.get(f"{self._crawler_root}/job/{job_id}")
+        response.raise_for_status()
+        return Job(_loads(response.content))
+
+    def get_job_status_only(self, job_id: str) -> JobStatus:
+        """
+        Get only the status fields of a job, without building the full Job.
+
+        The response is streamed and, when ijson is installed, parsed only until
+        the status and recommended poll delay are found. Use this to poll large
+        jobs, then call ``get_job`` once the job is terminal.
+
+        Args:
+            job_id (str): The unique identifier of the job
+
+        Returns:
+            JobStatus: The job's status and recommended poll delay
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        return self._poll_once(job_id, None)
+
+    def _poll_once(self, job_id: str, wait_ms: Optional[int]) -> JobStatus:
+        """
+        Fetch a job's status, long-polling the server for up to ``wait_ms``
+        milliseconds when it is set.
+
+        If the server rejects the ``wait`` parameter with 400 Bad Request,
+        long polling is disabled for this client and a regular request is made.
+        """
+        url = f"{self._crawler_root}/job/{job_id}"
+        if not wait_ms:
+            response = self.session.get(url, headers=_JOB_STATUS_HEADERS, stream=True)
+        else:
+            response = self.session.get(
+                url,
+                params={"wait": wait_ms},
+                headers=_JOB_STATUS_HEADERS,
+                timeout=(5, wait_ms / 1000 + 5),
+                stream=True,
+            )
+            if response.status_code == 400:
+                response.close()
+                self.long_poll_ms = None
+                return self._poll_once(job_id, None)
+
+        if not response.ok:
+            response.close()
         response.raise_for_status()
-        return Job(response.json())
+        return _read_job_status(job_id, response)
 
     def get_job_markdown(self, job_id: str) -> str:
         """
@@ -136,9 +606,7 @@ class WebCrawlerAPI:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        response = self.session.get(
-            urljoin(self.base_url, f"/{CRAWLER_VERSION}/job/{job_id}/markdown")
-        )
+        response = self.session.get(f"{self._crawler_root}/job/{job_id}/markdown")
 
         if not response.ok:
             try:
@@ -173,11 +641,9 @@ class WebCrawlerAPI:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        response = self.session.put(
-            urljoin(self.base_url, f"/{CRAWLER_VERSION}/job/{job_id}/cancel")
-        )
+        response = self.session.put(f"{self._crawler_root}/job/{job_id}/cancel")
         response.raise_for_status()
-        return cast(Dict[str, str], response.json())
+        return cast(Dict[str, str], _loads(response.content))
 
     def crawl(
         self,
@@ -192,14 +658,17 @@ class WebCrawlerAPI:
         main_content_only: bool = False,
         max_depth: Optional[int] = None,
         max_age: Optional[int] = None,
-        max_polls: int = 100,
+        max_polls: Optional[int] = None,
+        max_wait_seconds: Optional[float] = None,
     ) -> Job:
         """
         Start a new crawling job and wait for its completion.
 
         This method will start a crawling job and continuously poll its status
         until it reaches a terminal state (done, error, or cancelled) or until
-        the maximum number of polls is reached.
+        max_wait_seconds have passed. The wait between polls starts
+        at MIN_POLL_MS and grows exponentially with jitter up to MAX_POLL_MS,
+        never shorter than the server's recommended_pull_delay_ms.
 
         Args:
             url (str): The seed URL where the crawler starts
@@ -213,14 +682,80 @@ class WebCrawlerAPI:
             main_content_only (bool): Whether to extract only main content (default: False)
             max_depth (int, optional): Maximum depth of crawl (0 for seed URL only, 1 for one level deep, etc.)
             max_age (int, optional): Maximum age in seconds for cached content. If specified, returns cached results if available and not older than max_age seconds. Use 0 to bypass cache.
-            max_polls (int): Maximum number of status checks before returning (default: 100)
+            max_polls (int, optional): Deprecated, use max_wait_seconds. Converted to max_polls * DEFAULT_POLL_DELAY_SECONDS seconds
+            max_wait_seconds (float, optional): Maximum number of seconds to wait for completion before returning the last known state (default: DEFAULT_MAX_WAIT_SECONDS)
 
         Returns:
-            Job: The final job state after completion or max polls
+            Job: The final job state after completion or max_wait_seconds
 
         Raises:
             requests.exceptions.RequestException: If any API request fails
         """
+        response = self.crawl_async(
+            url=url,
+            scrape_type=scrape_type,
+            items_limit=items_limit,
+            webhook_url=webhook_url,
+            whitelist_regexp=whitelist_regexp,
+            blacklist_regexp=blacklist_regexp,
+            actions=actions,
+            respect_robots_txt=respect_robots_txt,
+            main_content_only=main_content_only,
+            max_depth=max_depth,
+            max_age=max_age,
+        )
+        max_wait = _resolve_max_wait(
+            max_wait_seconds,
+            max_polls,
+            self.DEFAULT_MAX_WAIT_SECONDS,
+            self.DEFAULT_POLL_DELAY_SECONDS,
+        )
+        return self._poll_until_done(response.id, max_wait)
+
+    def crawl_future(
+        self,
+        url: str,
+        scrape_type: str = "markdown",
+        items_limit: int = 10,
+        webhook_url: Optional[str] = None,
+        whitelist_regexp: Optional[str] = None,
+        blacklist_regexp: Optional[str] = None,
+        actions: Optional[Union[Action, List[Action]]] = None,
+        respect_robots_txt: bool = False,
+        main_content_only: bool = False,
+        max_depth: Optional[int] = None,
+        max_age: Optional[int] = None,
+        max_wait_seconds: Optional[float] = None,
+    ) -> JobHandle:
+        """
+        Start a new crawling job and poll it on a shared background thread pool.
+
+        The job is started before this method returns, so request errors are
+        raised here. Polling then runs like in ``crawl``, without blocking the
+        calling thread. The pool has 32 threads shared by all clients; use
+        ``crawl`` from your own threads when more jobs must be polled at once.
+
+        Args:
+            url (str): The seed URL where the crawler starts
+            scrape_type (str): Type of scraping (html, cleaned, markdown)
+            items_limit (int): Maximum number of pages to crawl
+            webhook_url (str, optional): URL for webhook notifications
+            whitelist_regexp (str, optional): Regex pattern for URL whitelist
+            blacklist_regexp (str, optional): Regex pattern for URL blacklist
+            actions (Action or List[Action], optional): Actions to perform during crawling
+            respect_robots_txt (bool): Whether to respect robots.txt file (default: False)
+            main_content_only (bool): Whether to extract only main content (default: False)
+            max_depth (int, optional): Maximum depth of crawl (0 for seed URL only, 1 for one level deep, etc.)
+            max_age (int, optional): Maximum age in seconds for cached content. If specified, returns cached results if available and not older than max_age seconds. Use 0 to bypass cache.
+            max_wait_seconds (float, optional): Maximum number of seconds to wait for completion before returning the last known state (default: DEFAULT_MAX_WAIT_SECONDS)
+
+        Returns:
+            JobHandle: Future resolving to the final job state, with the job ID
+                in ``job_id``. ``cancel_job()`` cancels the job on the server.
+
+        Raises:
+            requests.exceptions.RequestException: If starting the job fails
+        """
         # Start the crawling job
         response = self.crawl_async(
             url=url,
@@ -236,26 +771,209 @@ class WebCrawlerAPI:
             max_age=max_age,
         )
 
-        job_id = response.id
-        polls = 0
-        job = self.get_job(job_id)
+        if max_wait_seconds is None:
+            max_wait_seconds = self.DEFAULT_MAX_WAIT_SECONDS
+        handle = JobHandle(self, response.id)
+        _poll_pool().submit(
+            handle._run,
+            lambda: self._poll_until_done(
+                handle.job_id, max_wait_seconds, _POLL_POOL_SHUTDOWN
+            ),
+        )
+        return handle
 
-        while polls < max_polls:
-            if job.is_terminal:
-                return job
+    def _poll_until_done(
+        self,
+        job_id: str,
+        max_wait_seconds: float,
+        stop: Optional[threading.Event] = None,
+    ) -> Job:
+        """
+        Poll a job until it is terminal or the time budget runs out.
 
-            delay_seconds = (
-                job.recommended_pull_delay_ms / 1000
-                if job.recommended_pull_delay_ms
-                else self.DEFAULT_POLL_DELAY_SECONDS
-            )
+        Raises:
+            RuntimeError: If stop is set while the job is still running
+        """
+        deadline = time.monotonic() + max_wait_seconds
+        polls = 0
+        fast_long_polls = 0
+        status = self.get_job_status_only(job_id)
+        # The first long-poll request is sent right away; it waits on the server
+        delay = (
+            0.0
+            if self.long_poll_ms
+            else self._poll_delay(polls, status.recommended_pull_delay_ms)
+        )
+
+        while not status.is_terminal:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            delay = min(delay, remaining)
+            if delay > 0:
+                if stop is None:
+                    time.sleep(delay)
+                else:
+                    # Waiting on the stop event wakes up as soon as it is set
+                    stop.wait(delay)
+            if stop is not None and stop.is_set():
+                # The job is still running, so there is no final state to return
+                raise RuntimeError(
+                    f"Stopped polling job {job_id} because the interpreter is exiting"
+                )
 
-            time.sleep(delay_seconds)
+            wait_ms = None
+            if self.long_poll_ms:
+                remaining = max(deadline - time.monotonic(), 0.001)
+                wait_ms = min(self.long_poll_ms, math.ceil(remaining * 1000))
             polls += 1
-            job = self.get_job(job_id)
+            started = time.monotonic()
+            status = self._poll_once(job_id, wait_ms)
+            elapsed = time.monotonic() - started
+
+            # Time a long-poll request was held on the server counts towards
+            # the wait, so only the rest of the poll delay is slept
+            delay = self._poll_delay(polls, status.recommended_pull_delay_ms) - elapsed
+            if wait_ms is not None and self.long_poll_ms:
+                if elapsed * 1000 < wait_ms * self.LONG_POLL_FAST_RATIO:
+                    fast_long_polls += 1
+                else:
+                    fast_long_polls = 0
+                # A server that ignores ``wait`` answers every request at once
+                if fast_long_polls >= self.LONG_POLL_MAX_FAST_RESPONSES:
+                    self.long_poll_ms = None
+
+        # Fetch the full job once it is terminal or the budget is spent
+        return self.get_job(job_id)
+
+    def crawl_batch(
+        self,
+        urls: List[str],
+        max_workers: int = 16,
+        max_wait_seconds: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Iterator[Job]:
+        """
+        Crawl several seed URLs in parallel and iterate over jobs as they finish.
+
+        All jobs are started concurrently before this method returns, then
+        polled together while the returned iterator is consumed: every poll
+        round fetches the status of all unfinished jobs in parallel and
+        sleeps once for the shortest recommended delay among them.
+
+        Args:
+            urls (List[str]): The seed URLs to crawl
+            max_workers (int): Maximum number of concurrent requests (default: 16)
+            max_wait_seconds (float, optional): Maximum number of seconds to wait for all jobs (default: DEFAULT_MAX_WAIT_SECONDS)
+            **kwargs: Extra arguments passed to ``crawl_async`` for every URL
 
-        # Return the last known state if max_polls is reached
-        return job
+        Returns:
+            Iterator[Job]: Each job once it reaches a terminal state, in
+                completion order. Jobs still running after max_wait_seconds
+                are yielded last, in their last known state.
+
+        Raises:
+            requests.exceptions.RequestException: If starting any job fails.
+                The jobs that did start are cancelled before the error is
+                raised. A job whose polling keeps failing until the deadline
+                raises its error from the iterator once every other job has
+                been yielded.
+        """
+        if max_wait_seconds is None:
+            max_wait_seconds = self.DEFAULT_MAX_WAIT_SECONDS
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.crawl_async, url, **kwargs) for url in urls]
+        job_ids: List[str] = []
+        errors: List[BaseException] = []
+        for future in futures:
+            error = future.exception()
+            if error is None:
+                job_ids.append(future.result().id)
+            else:
+                errors.append(error)
+        if errors:
+            # Started jobs are billed, so they are not left running unseen
+            for job_id in job_ids:
+                try:
+                    self.cancel_job(job_id)
+                except requests.exceptions.RequestException:
+                    pass
+            raise errors[0]
+        return self._poll_batch(job_ids, max_workers, max_wait_seconds)
+
+    def _poll_batch(
+        self, job_ids: List[str], max_workers: int, max_wait_seconds: float
+    ) -> Iterator[Job]:
+        """Poll started jobs together and yield each one once it is finished."""
+        deadline = time.monotonic() + max_wait_seconds
+        pending = job_ids
+        polls = 0
+        errors: List[requests.exceptions.RequestException] = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending:
+                status_futures = [
+                    (job_id, executor.submit(self.get_job_status_only, job_id))
+                    for job_id in pending
+                ]
+                remaining = deadline - time.monotonic()
+                still_pending: List[str] = []
+                finished: List[str] = []
+                recommended: List[int] = []
+                for job_id, status_future in status_futures:
+                    try:
+                        status = status_future.result()
+                    except requests.exceptions.RequestException as exc:
+                        # A failed poll of one job must not drop the others;
+                        # it is retried until the deadline
+                        if remaining <= 0:
+                            errors.append(exc)
+                        else:
+                            still_pending.append(job_id)
+                        continue
+                    if status.is_terminal or remaining <= 0:
+                        finished.append(job_id)
+                    else:
+                        still_pending.append(job_id)
+                        recommended.append(status.recommended_pull_delay_ms)
+
+                # Only finished jobs are fetched in full
+                job_futures = [
+                    (job_id, executor.submit(self.get_job, job_id))
+                    for job_id in finished
+                ]
+                for job_id, job_future in job_futures:
+                    try:
+                        job = job_future.result()
+                    except requests.exceptions.RequestException as exc:
+                        if remaining <= 0:
+                            errors.append(exc)
+                        else:
+                            still_pending.append(job_id)
+                        continue
+                    yield job
+
+                if not still_pending:
+                    break
+
+                pending = still_pending
+                recommended_ms = min(recommended) if recommended else None
+                time.sleep(min(self._poll_delay(polls, recommended_ms), remaining))
+                polls += 1
+
+        if errors:
+            raise errors[0]
+
+    def _poll_delay(self, polls: int, recommended_ms: Optional[int] = None) -> float:
+        """Get the number of seconds to wait before the next status poll."""
+        return _backoff_delay(
+            polls,
+            recommended_ms,
+            self.MIN_POLL_MS,
+            self.MAX_POLL_MS,
+            self.POLL_BACKOFF_FACTOR,
+            self.POLL_JITTER,
+        )
 
     def crawl_raw_markdown(
         self,
@@ -270,11 +988,14 @@ class WebCrawlerAPI:
         main_content_only: bool = False,
         max_depth: Optional[int] = None,
         max_age: Optional[int] = None,
-        max_polls: int = 100,
+        max_polls: Optional[int] = None,
+        max_wait_seconds: Optional[float] = None,
     ) -> str:
         """
         Run a crawl job and return the combined markdown output when finished.
 
+        Accepts the same arguments as ``crawl``.
+
         Raises:
             requests.exceptions.RequestException: If any API request fails
         """
@@ -290,7 +1011,13 @@ class WebCrawlerAPI:
             main_content_only=main_content_only,
             max_depth=max_depth,
             max_age=max_age,
-            max_polls=max_polls,
+            # Resolved here so a max_polls warning points at the caller
+            max_wait_seconds=_resolve_max_wait(
+                max_wait_seconds,
+                max_polls,
+                self.DEFAULT_MAX_WAIT_SECONDS,
+                self.DEFAULT_POLL_DELAY_SECONDS,
+            ),
         )
 
         if job.scrape_type != "markdown":
@@ -339,32 +1066,22 @@ class WebCrawlerAPI:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        payload = {
-            "url": url,
-            "output_format": output_format,
-            "respect_robots_txt": respect_robots_txt,
-            "main_content_only": main_content_only,
-        }
-
-        if webhook_url:
-            payload["webhook_url"] = webhook_url
-        if clean_selectors:
-            payload["clean_selectors"] = clean_selectors
-        if prompt:
-            payload["prompt"] = prompt
-        if response_schema is not None:
-            payload["response_schema"] = response_schema
-        if max_age is not None:
-            payload["max_age"] = max_age
-        if actions:
-            # Convert single action to list if needed
-            action_list = [actions] if not isinstance(actions, list) else actions
-            # Convert dataclass objects to dictionaries
-            payload["actions"] = [vars(action) for action in action_list]
+        payload = _build_scrape_payload(
+            url=url,
+            output_format=output_format,
+            webhook_url=webhook_url,
+            clean_selectors=clean_selectors,
+            prompt=prompt,
+            response_schema=response_schema,
+            actions=actions,
+            respect_robots_txt=respect_robots_txt,
+            main_content_only=main_content_only,
+            max_age=max_age,
+        )
 
         response = self.session.post(
-            urljoin(self.base_url, f"/{SCRAPER_VERSION}/scrape?async=true"),
-            json=payload,
+            f"{self._scraper_root}/scrape?async=true",
+            data=_dumps(payload),
         )
 
         if not response.ok:
@@ -380,7 +1097,7 @@ class WebCrawlerAPI:
                 )
 
         response.raise_for_status()
-        return ScrapeId(id=response.json()["id"])
+        return ScrapeId(id=_loads(response.content)["id"])
 
     def get_scrape(self, scrape_id: str) -> Union[ScrapeResponse, ScrapeResponseError]:
         """
@@ -395,36 +1112,10 @@ class WebCrawlerAPI:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        response = self.session.get(
-            urljoin(self.base_url, f"/{SCRAPER_VERSION}/scrape/{scrape_id}")
-        )
+        response = self.session.get(f"{self._scraper_root}/scrape/{scrape_id}")
 
         response.raise_for_status()
-        response_data = response.json()
-
-        status = response_data.get("status")
-
-        if status == "done":
-            return ScrapeResponse(
-                success=response_data.get("success", True),
-                status=status,
-                markdown=response_data.get("markdown"),
-                cleaned_content=response_data.get("cleaned_content"),
-                raw_content=response_data.get("raw_content"),
-                page_status_code=response_data.get("page_status_code", 0),
-                page_title=response_data.get("page_title"),
-                structured_data=response_data.get("structured_data"),
-                links=response_data.get("links"),
-            )
-        elif status == "error":
-            return ScrapeResponseError(
-                success=False,
-                error_code=response_data.get("error_code", "unknown"),
-                error_message=response_data.get("error_message", "Scraping failed"),
-                status=status,
-            )
-        else:  # in_progress or any other status
-            return ScrapeResponse(success=False, status=status)
+        return _parse_scrape_response(_loads(response.content))
 
     def scrape(
         self,
@@ -438,14 +1129,16 @@ class WebCrawlerAPI:
         respect_robots_txt: bool = False,
         main_content_only: bool = False,
         max_age: Optional[int] = None,
-        max_polls: int = 100,
+        max_polls: Optional[int] = None,
+        max_wait_seconds: Optional[float] = None,
     ) -> Union[ScrapeResponse, ScrapeResponseError]:
         """
         Scrape a single URL and wait for completion.
 
         This method will start a scraping job and continuously poll its status
         until it reaches a terminal state (done or error) or until
-        the maximum number of polls is reached.
+        max_wait_seconds have passed. The wait between polls starts
+        at MIN_POLL_MS and grows exponentially with jitter up to MAX_POLL_MS.
 
         Args:
             url (str): The URL to scrape
@@ -458,7 +1151,8 @@ class WebCrawlerAPI:
             respect_robots_txt (bool): Whether to respect robots.txt file (default: False)
             main_content_only (bool): Whether to extract only main content (default: False)
             max_age (int, optional): Maximum age in seconds for cached content. If specified, returns cached results if available and not older than max_age seconds. Use 0 to bypass cache.
-            max_polls (int): Maximum number of status checks before returning (default: 100)
+            max_polls (int, optional): Deprecated, use max_wait_seconds. Converted to max_polls * DEFAULT_POLL_DELAY_SECONDS seconds
+            max_wait_seconds (float, optional): Maximum number of seconds to wait for completion before returning the last known state (default: DEFAULT_MAX_WAIT_SECONDS)
 
         Returns:
             Union[ScrapeResponse, ScrapeResponseError]: The final scrape result
@@ -480,19 +1174,28 @@ class WebCrawlerAPI:
             max_age=max_age,
         )
 
+        max_wait = _resolve_max_wait(
+            max_wait_seconds,
+            max_polls,
+            self.DEFAULT_MAX_WAIT_SECONDS,
+            self.DEFAULT_POLL_DELAY_SECONDS,
+        )
         scrape_id = response.id
+        deadline = time.monotonic() + max_wait
         polls = 0
         result: Union[ScrapeResponse, ScrapeResponseError] = self.get_scrape(scrape_id)
 
-        while polls < max_polls:
+        while True:
             if isinstance(result, ScrapeResponse) and result.status == "done":
                 return result
 
             if isinstance(result, ScrapeResponseError):
                 return result
 
-            time.sleep(self.DEFAULT_POLL_DELAY_SECONDS)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return result
+
+            time.sleep(min(self._poll_delay(polls), remaining))
             polls += 1
             result = self.get_scrape(scrape_id)
-
-        return result
@@ -0,0 +1,155 @@
+import io
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # httpx is an optional dependency
+    httpx = None  # type: ignore[assignment]
+
+
+class HTTPXResponse:
+    """
+    An httpx response exposed through the subset of ``requests.Response``
+    used by the client, so error handling stays the same on both transports.
+    """
+
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self.status_code = response.status_code
+        self.reason = response.reason_phrase
+        self.url = str(response.url)
+        self.content = response.content
+        # Bodies are read eagerly; raw lets streaming parsers read them as a file
+        self.raw = io.BytesIO(self.content)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is below 400."""
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        """The decoded response body."""
+        return self._response.text
+
+    def json(self) -> Any:
+        """Decode the response body as JSON."""
+        return self._response.json()
+
+    def close(self) -> None:
+        """Release the response."""
+        self._response.close()
+
+    def raise_for_status(self) -> None:
+        """
+        Raise for 4xx and 5xx responses, like ``requests.Response`` does.
+
+        Raises:
+            requests.exceptions.HTTPError: If the response is an error
+        """
+        if self.ok:
+            return
+        kind = "Client" if self.status_code < 500 else "Server"
+        raise requests.exceptions.HTTPError(
+            f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}",
+            response=self,
+        )
+
+
+class HTTPXSession:
+    """
+    HTTP/2 transport with the ``requests.Session`` methods used by the client.
+
+    Concurrent requests are multiplexed over a single TLS connection per host,
+    so parallel polling (for example ``crawl_batch``) needs no extra handshakes.
+    Transport errors are re-raised as their ``requests`` equivalents.
+    Requires the optional ``httpx`` dependency
+    (``pip install webcrawlerapi[http2]``).
+    """
+
+    def __init__(self, pool_size: int):
+        """
+        Initialize the HTTP/2 session.
+
+        Args:
+            pool_size (int): Number of keep-alive connections to keep open
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "HTTP/2 support requires httpx. "
+                "Install it with: pip install webcrawlerapi[http2]"
+            )
+
+        # No timeout by default, matching requests
+        self.client = httpx.Client(
+            http2=True,
+            timeout=None,
+            limits=httpx.Limits(
+                max_keepalive_connections=pool_size,
+                max_connections=pool_size * 2,
+            ),
+        )
+
+    @property
+    def headers(self) -> "httpx.Headers":
+        """Headers sent with every request."""
+        return self.client.headers
+
+    def get(self, url: str, **kwargs: Any) -> HTTPXResponse:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> HTTPXResponse:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> HTTPXResponse:
+        """Send a PUT request."""
+        return self.request("PUT", url, **kwargs)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        stream: bool = False,
+    ) -> HTTPXResponse:
+        """
+        Send a request, accepting the requests keyword arguments the client uses.
+
+        ``stream`` is accepted for compatibility; bodies are always read in full.
+
+        Raises:
+            requests.exceptions.Timeout: If the request times out
+            requests.exceptions.ConnectionError: If the connection fails
+        """
+        kwargs: Dict[str, Any] = {
+            "content": data,
+            "params": params,
+            "headers": headers,
+        }
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            kwargs["timeout"] = httpx.Timeout(None, connect=connect, read=read)
+        elif timeout is not None:
+            kwargs["timeout"] = timeout
+
+        try:
+            response = self.client.request(method, url, **kwargs)
+        except httpx.TimeoutException as exc:
+            raise requests.exceptions.Timeout(str(exc)) from exc
+        except httpx.TransportError as exc:
+            raise requests.exceptions.ConnectionError(str(exc)) from exc
+        return HTTPXResponse(response)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.client.close()
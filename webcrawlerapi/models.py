@@ -1,34 +1,80 @@
 import re
+import sys
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+try:
+    import ciso8601
+except ImportError:  # ciso8601 is an optional speedup
+    ciso8601 = None  # type: ignore[assignment]
+
+_fromisoformat = datetime.fromisoformat
+
+# Python 3.11+ parses a trailing "Z" itself, so the string needs no rewrite
+_FROMISOFORMAT_PARSES_Z = sys.version_info >= (3, 11)
+
+# Matches: YYYY-MM-DDTHH:MM:SS.microseconds followed by timezone or end
+_FRACTION_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d+)(.*)")
 
 
 def parse_datetime(datetime_str: str) -> datetime:
     """
     Parse datetime string from API response, handling various microsecond formats.
 
+    Uses the ciso8601 C parser when it is installed, with its UTC offsets
+    converted to ``datetime.timezone`` so results match the fallback. Otherwise
+    the string is handed straight to ``datetime.fromisoformat`` and only
+    normalized when that fails, which avoids regex work for the common API
+    formats.
+
     Args:
         datetime_str (str): Datetime string from API
 
     Returns:
         datetime: Parsed datetime object
     """
-    # Replace 'Z' with '+00:00' for timezone
-    datetime_str = datetime_str.replace("Z", "+00:00")
-
-    # Handle microseconds - pad to 6 digits or remove if present
-    # Pattern matches: YYYY-MM-DDTHH:MM:SS.microseconds followed by timezone or end
-    pattern = r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d+)(.*)"
-    match = re.match(pattern, datetime_str)
+    # ciso8601 also accepts a lowercase "z", which fromisoformat rejects
+    if ciso8601 is not None and not datetime_str.endswith("z"):
+        try:
+            result = ciso8601.parse_datetime(datetime_str)
+        except ValueError:
+            pass
+        else:
+            offset = result.utcoffset()
+            if offset is not None and not isinstance(result.tzinfo, timezone):
+                result = result.replace(tzinfo=timezone(offset))
+            return result
+
+    # Replace 'Z' with '+00:00' for timezone on older Pythons
+    if not _FROMISOFORMAT_PARSES_Z and datetime_str.endswith("Z"):
+        datetime_str = datetime_str[:-1] + "+00:00"
+
+    try:
+        return _fromisoformat(datetime_str)
+    except ValueError:
+        pass
+
+    # Handle microseconds - pad to 6 digits or truncate if longer
+    match = _FRACTION_PATTERN.match(datetime_str)
 
     if match:
         base_time, microseconds, timezone_part = match.groups()
-        # Pad microseconds to 6 digits or truncate if longer
         microseconds = microseconds.ljust(6, "0")[:6]
         datetime_str = f"{base_time}.{microseconds}{timezone_part}"
 
-    return datetime.fromisoformat(datetime_str)
+    return _fromisoformat(datetime_str)
 
 
 @dataclass
@@ -38,6 +84,20 @@ class CrawlResponse:
     id: str
 
 
+@dataclass
+class JobStatus:
+    """Polling fields of a crawling job, read without building the full Job."""
+
+    id: str
+    status: str
+    recommended_pull_delay_ms: int = 0
+
+    @property
+    def is_terminal(self) -> bool:
+        """Check if the job is in a terminal state (done, error, or cancelled)."""
+        return self.status in Job.TERMINAL_STATUSES
+
+
 @dataclass
 class ScrapeId:
     """Response from an asynchronous scrape request."""
@@ -106,6 +166,28 @@ class UploadS3Action(Action):
 class JobItem:
     """Represents a single crawled page item in a job."""
 
+    # Large jobs hold thousands of items; slots drop the per-instance __dict__
+    __slots__ = (
+        "id",
+        "job_id",
+        "original_url",
+        "page_status_code",
+        "status",
+        "title",
+        "created_at",
+        "updated_at",
+        "cost",
+        "referred_url",
+        "last_error",
+        "error_code",
+        "depth",
+        "raw_content_url",
+        "cleaned_content_url",
+        "markdown_content_url",
+        "_job",
+        "_content",
+    )
+
     def __init__(self, data: Dict[str, Any], job: "Job"):
         """
         Initialize a JobItem.
@@ -188,10 +270,88 @@ class JobItem:
         return self._content
 
 
+class _LazyJobItems(Sequence[JobItem]):
+    """
+    Read-only list of a job's items that builds each JobItem on first access.
+
+    Polling only needs the job status, so the raw item dicts are kept as-is
+    until the caller actually reads them. Built items are cached, so the same
+    index always returns the same JobItem (and its cached content).
+    """
+
+    __slots__ = ("_raw_items", "_job", "_items")
+
+    def __init__(self, raw_items: List[Dict[str, Any]], job: "Job"):
+        self._raw_items = raw_items
+        self._job = job
+        self._items: Dict[int, JobItem] = {}
+
+    def __len__(self) -> int:
+        return len(self._raw_items)
+
+    @overload
+    def __getitem__(self, index: int) -> JobItem: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[JobItem]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[JobItem, List[JobItem]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw_items)))]
+
+        if index < 0:
+            index += len(self._raw_items)
+        if not 0 <= index < len(self._raw_items):
+            raise IndexError("job item index out of range")
+
+        item = self._items.get(index)
+        if item is None:
+            item = JobItem(self._raw_items[index], self._job)
+            self._items[index] = item
+        return item
+
+    def __iter__(self) -> Iterator[JobItem]:
+        for index in range(len(self._raw_items)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        # Compares like a list, but with any sequence, e.g. job.job_items == []
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            item == other_item for item, other_item in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class Job:
     """Represents a crawling job."""
 
-    TERMINAL_STATUSES = {"done", "error", "cancelled"}
+    TERMINAL_STATUSES: ClassVar[FrozenSet[str]] = frozenset(
+        {"done", "error", "cancelled"}
+    )
+
+    __slots__ = (
+        "id",
+        "org_id",
+        "url",
+        "status",
+        "scrape_type",
+        "whitelist_regexp",
+        "blacklist_regexp",
+        "items_limit",
+        "max_depth",
+        "created_at",
+        "updated_at",
+        "webhook_url",
+        "recommended_pull_delay_ms",
+        "finished_at",
+        "webhook_status",
+        "webhook_error",
+        "job_items",
+    )
 
     def __init__(self, data: Dict[str, Any]):
         self.id: str = data["id"]
@@ -216,10 +376,10 @@ class Job:
         self.webhook_status: Optional[str] = data.get("webhook_status")
         self.webhook_error: Optional[str] = data.get("webhook_error")
 
-        # Parse job items with reference to self
-        self.job_items: List[JobItem] = [
-            JobItem(item, self) for item in data.get("job_items", [])
-        ]
+        # Job items are built lazily, with a reference to self
+        self.job_items: Sequence[JobItem] = _LazyJobItems(
+            data.get("job_items", []), self
+        )
 
     @property
     def is_terminal(self) -> bool: